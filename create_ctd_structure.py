@@ -4,14 +4,364 @@ CTD STRUCTURE BUILDER
 Creates complete CTD folder structure in organized_ctd
 """
 
+import hashlib
 import json
 import os
 import shutil
-from typing import Dict, List
+import subprocess
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, NamedTuple
+
+# Optional fast JSON encoder; falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configuration
 CTD_STRUCTURE_FILE = "ctd_structure.json"
 OUTPUT_FOLDER = "organized_ctd"
+BUILD_MARKER = ".ctd_built"
+MKDIR_WORKERS = 16
+_SEP = os.sep
+
+# Invalid characters for Windows/Linux folder names, mapped to '-'
+_INVALID_TRANS = str.maketrans({char: '-' for char in '<>:"/\\|?*'})
+
+class Node(NamedTuple):
+    """Compact CTD folder node used when creating folders"""
+    name: str
+    children: tuple = ()
+
+# Labelling sections repeat the same approval-state x language layout
+_LANGS = ("English", "French", "Portuguese")
+_STATES = ("Approved", "Clean", "Annotated")
+
+def _make_state_subtree(category, prefix):
+    """Build the approval-state x language subfolders for a labelling section"""
+    return [
+        {
+            "name": f"{prefix}.{i} {state} - {category}",
+            "children": [
+                {"name": f"{prefix}.{i}.{j} {state} - {category} - {lang}"}
+                for j, lang in enumerate(_LANGS, 1)
+            ]
+        }
+        for i, state in enumerate(_STATES, 1)
+    ]
+
+# The most comprehensive CTD structure, built once at import.
+# Other scripts import this directly instead of re-parsing the JSON file.
+CTD_STRUCTURE = {
+    "name": "CTD Structure",
+    "description": "Common Technical Document Structure",
+    "children": [
+        {
+            "name": "Module 1 Administrative Information and Prescribing Information",
+            "description": "Administrative documents and product information",
+            "children": [
+                {
+                    "name": "1.0 Correspondence",
+                    "children": [
+                        {"name": "1.0.1 Cover Letter", "description": "Cover letters and introductory documents"},
+                        {"name": "1.0.2 General Note to Reviewer", "description": "Notes to regulatory reviewers"},
+                        {"name": "1.0.3 Life Cycle Management Tracking Table", "description": "Life cycle management documents"},
+                        {"name": "1.0.4 Correspondence Issued by Regulatory Authority", "description": "Regulatory authority correspondence"},
+                        {"name": "1.0.5 Response to Information Solicited by Regulatory Authority", "description": "Responses to regulatory queries"},
+                        {"name": "1.0.6 Meeting Information", "description": "Meeting minutes and notes"},
+                        {"name": "1.0.7 Request for Appeal Documentation", "description": "Appeal documentation"}
+                    ]
+                },
+                {
+                    "name": "1.2 Administrative Information",
+                    "children": [
+                        {"name": "1.2.1 Application Form", "description": "Regulatory application forms"},
+                        {"name": "1.2.2 Fee Forms", "description": "Fee payment forms"},
+                        {"name": "1.2.3 Certification and Attestation Forms", "description": "Certification documents"},
+                        {"name": "1.2.4 Compliance and Site Information", "description": "Site compliance information"},
+                        {"name": "1.2.5 Authorization for Sharing Information", "description": "Information sharing authorizations"},
+                        {"name": "1.2.6 Electronic Declaration", "description": "Electronic declarations"},
+                        {"name": "1.2.7 Trademark & Intellectual Property Information", "description": "Trademark and IP documents"},
+                        {"name": "1.2.8 Screening Details", "description": "Screening information"},
+                        {"name": "1.2.A Additional Administrative Information", "description": "Additional administrative documents"}
+                    ]
+                },
+                {
+                    "name": "1.3 Product Information",
+                    "children": [
+                        {
+                            "name": "1.3.1 Summary of Product Characteristics (SmPC)",
+                            "children": _make_state_subtree("SmPC", "1.3.1")
+                        },
+                        {
+                            "name": "1.3.2 Patient Information Leaflet (PIL)",
+                            "children": _make_state_subtree("PIL", "1.3.2")
+                        },
+                        {
+                            "name": "1.3.3 Container Labels",
+                            "children": _make_state_subtree("Container Labels", "1.3.3")
+                        },
+                        {"name": "1.3.4 Foreign Labelling", "description": "Foreign labeling documents"},
+                        {"name": "1.3.5 Reference Product Labelling", "description": "Reference product labeling"},
+                        {"name": "1.3.6 Artwork and Samples", "description": "Artwork and sample documentation"}
+                    ]
+                },
+                {
+                    "name": "1.4 Information about the Experts",
+                    "children": [
+                        {"name": "1.4.1 Quality", "description": "Quality expert information"},
+                        {"name": "1.4.2 Non-Clinical", "description": "Non-clinical expert information"},
+                        {"name": "1.4.3 Clinical", "description": "Clinical expert information"}
+                    ]
+                },
+                {
+                    "name": "1.5 Specific Requirements for Different Types of Applications",
+                    "children": [
+                        {"name": "1.5.1 Bioequivalence Trial Information", "description": "Bioequivalence trial documentation"}
+                    ]
+                },
+                {
+                    "name": "1.6 Environmental Risk Assessment",
+                    "children": [
+                        {"name": "1.6.1 Non-GMO", "description": "Non-GMO documentation"},
+                        {"name": "1.6.2 GMO", "description": "GMO documentation"}
+                    ]
+                },
+                {
+                    "name": "1.7 Good Manufacturing Practice (GMP)",
+                    "children": [
+                        {"name": "1.7.1 Date of Inspection of Each Site", "description": "Site inspection dates"},
+                        {"name": "1.7.2 Inspection Reports or Equivalent Documents", "description": "Inspection reports"},
+                        {"name": "1.7.3 GMP Certificates or Manufacturing Licences", "description": "GMP certificates"},
+                        {"name": "1.7.4 Other GMP Documents", "description": "Other GMP documentation"}
+                    ]
+                },
+                {
+                    "name": "1.8 Information Relating to Pharmacovigilance",
+                    "children": [
+                        {"name": "1.8.1 Pharmacovigilance System", "description": "Pharmacovigilance system documentation"},
+                        {"name": "1.8.2 Risk-management System", "description": "Risk management documentation"}
+                    ]
+                },
+                {"name": "1.9 Individual Patient Data - Statement of Availability", "description": "Patient data availability statements"},
+                {
+                    "name": "1.10 Foreign Regulatory Information",
+                    "children": [
+                        {"name": "1.10.1 Regional & Foreign Regulatory Status", "description": "Regulatory status information"},
+                        {"name": "1.10.2 WHO Type Certificate of Pharmaceutical Product (COPP)", "description": "WHO certificates"},
+                        {"name": "1.10.3 Data Set Similarities and Differences", "description": "Data set comparisons"},
+                        {"name": "1.10.4 Foreign Evaluation Reports", "description": "Foreign evaluation reports"}
+                    ]
+                },
+                {
+                    "name": "1.A Additional Data",
+                    "children": [
+                        {"name": "1.A.1 Country Specific Data", "description": "Country-specific documentation"}
+                    ]
+                }
+            ]
+        },
+        {
+            "name": "Module 2 Common Technical Document Summaries",
+            "description": "CTD summaries and overviews",
+            "children": [
+                {"name": "2.2 Introduction to Summary", "description": "Summary introduction"},
+                {
+                    "name": "2.3 Quality Overall Summary (QOS)",
+                    "children": [
+                        {"name": "2.3 Introduction", "description": "QOS introduction"},
+                        {"name": "2.3.S Drug Substance", "description": "Drug substance summary"},
+                        {"name": "2.3.P Drug Product", "description": "Drug product summary"},
+                        {"name": "2.3.A Appendices", "description": "QOS appendices"},
+                        {"name": "2.3.R Regional Information", "description": "Regional information"}
+                    ]
+                },
+                {"name": "2.4 Nonclinical Overview", "description": "Nonclinical overview"},
+                {"name": "2.5 Clinical Overview", "description": "Clinical overview"},
+                {
+                    "name": "2.6 NonClinical Written and Tabulated Summaries",
+                    "children": [
+                        {"name": "2.6.1 Introduction", "description": "Nonclinical summaries introduction"},
+                        {"name": "2.6.2 Pharmacology Written Summary", "description": "Pharmacology written summary"},
+                        {"name": "2.6.3 Pharmacology Tabulated Summary", "description": "Pharmacology tabulated summary"},
+                        {"name": "2.6.4 Pharmacokinetics Written Summary", "description": "PK written summary"},
+                        {"name": "2.6.5 Pharmacokinetics Tabulated Summary", "description": "PK tabulated summary"},
+                        {"name": "2.6.6 Toxicology Written Summary", "description": "Toxicology written summary"},
+                        {"name": "2.6.7 Toxicology Tabulated Summary", "description": "Toxicology tabulated summary"}
+                    ]
+                },
+                {
+                    "name": "2.7 Clinical Summary",
+                    "children": [
+                        {"name": "2.7.1 Summary of Biopharmaceutic Studies", "description": "Biopharmaceutics summary"},
+                        {"name": "2.7.2 Summary of Clinical Pharmacology Studies", "description": "Clinical pharmacology summary"},
+                        {"name": "2.7.3 Summary of Clinical Efficacy", "description": "Clinical efficacy summary"},
+                        {"name": "2.7.4 Summary of Clinical Safety", "description": "Clinical safety summary"},
+                        {"name": "2.7.5 References", "description": "Clinical references"},
+                        {"name": "2.7.6 Synopses of Individual Studies", "description": "Study synopses"}
+                    ]
+                }
+            ]
+        },
+        {
+            "name": "Module 3 Quality",
+            "description": "Quality documentation",
+            "children": [
+                {
+                    "name": "3.2 Body of Data",
+                    "children": [
+                        {
+                            "name": "3.2.S Drug Substance",
+                            "children": [
+                                {
+                                    "name": "3.2.S.1 General Information",
+                                    "children": [
+                                        {"name": "3.2.S.1.1 Nomenclature", "description": "Drug substance nomenclature"},
+                                        {"name": "3.2.S.1.2 Structure", "description": "Drug substance structure"},
+                                        {"name": "3.2.S.1.3 General Properties", "description": "Drug substance properties"}
+                                    ]
+                                },
+                                {"name": "3.2.S.2 Manufacture", "description": "Drug substance manufacture"},
+                                {"name": "3.2.S.3 Characterization", "description": "Drug substance characterization"},
+                                {"name": "3.2.S.4 Control of Drug Substance", "description": "Drug substance control"},
+                                {"name": "3.2.S.5 Reference Standards or Materials", "description": "Reference standards"},
+                                {"name": "3.2.S.6 Container Closure Systems", "description": "Container closure systems"},
+                                {"name": "3.2.S.7 Stability", "description": "Drug substance stability"}
+                            ]
+                        },
+                        {
+                            "name": "3.2.P Drug Product",
+                            "children": [
+                                {"name": "3.2.P.1 Description and Composition", "description": "Drug product description"},
+                                {"name": "3.2.P.2 Pharmaceutical Development", "description": "Pharmaceutical development"},
+                                {"name": "3.2.P.3 Manufacture", "description": "Drug product manufacture"},
+                                {"name": "3.2.P.4 Control of Excipients", "description": "Excipient control"},
+                                {"name": "3.2.P.5 Control of Drug Product", "description": "Drug product control"},
+                                {"name": "3.2.P.6 Reference Standards or Materials", "description": "Reference standards"},
+                                {"name": "3.2.P.7 Container Closure System", "description": "Container closure system"},
+                                {"name": "3.2.P.8 Stability", "description": "Drug product stability"}
+                            ]
+                        }
+                    ]
+                },
+                {"name": "3.3 Literature References", "description": "Quality literature references"}
+            ]
+        },
+        {
+            "name": "Module 4 Nonclinical Study Reports",
+            "description": "Nonclinical study documentation",
+            "children": [
+                {
+                    "name": "4.2 Study Reports",
+                    "children": [
+                        {
+                            "name": "4.2.1 Pharmacology",
+                            "children": [
+                                {"name": "4.2.1.1 Primary Pharmacodynamics", "description": "Primary pharmacology studies"},
+                                {"name": "4.2.1.2 Secondary Pharmacodynamics", "description": "Secondary pharmacology studies"},
+                                {"name": "4.2.1.3 Safety Pharmacology", "description": "Safety pharmacology studies"},
+                                {"name": "4.2.1.4 Pharmacodynamic Drug Interactions", "description": "Pharmacodynamic interactions"}
+                            ]
+                        },
+                        {
+                            "name": "4.2.2 Pharmacokinetics",
+                            "children": [
+                                {"name": "4.2.2.1 Analytical Methods and Validation", "description": "Analytical methods"},
+                                {"name": "4.2.2.2 Absorption", "description": "Absorption studies"},
+                                {"name": "4.2.2.3 Distribution", "description": "Distribution studies"},
+                                {"name": "4.2.2.4 Metabolism", "description": "Metabolism studies"},
+                                {"name": "4.2.2.5 Excretion", "description": "Excretion studies"},
+                                {"name": "4.2.2.6 Pharmacokinetic Drug Interactions", "description": "PK interactions"},
+                                {"name": "4.2.2.7 Other Pharmacokinetic Studies", "description": "Other PK studies"}
+                            ]
+                        },
+                        {
+                            "name": "4.2.3 Toxicology",
+                            "children": [
+                                {"name": "4.2.3.1 Single-Dose Toxicity", "description": "Single-dose toxicity"},
+                                {"name": "4.2.3.2 Repeat-Dose Toxicity", "description": "Repeat-dose toxicity"},
+                                {"name": "4.2.3.3 Genotoxicity", "description": "Genotoxicity studies"},
+                                {"name": "4.2.3.4 Carcinogenicity", "description": "Carcinogenicity studies"},
+                                {"name": "4.2.3.5 Reproductive and Developmental Toxicity", "description": "Reproductive toxicity"},
+                                {"name": "4.2.3.6 Local Tolerance", "description": "Local tolerance studies"},
+                                {"name": "4.2.3.7 Other Toxicity Studies", "description": "Other toxicity studies"}
+                            ]
+                        }
+                    ]
+                },
+                {"name": "4.3 Literature References", "description": "Nonclinical literature references"}
+            ]
+        },
+        {
+            "name": "Module 5 Clinical Study Reports",
+            "description": "Clinical study documentation",
+            "children": [
+                {"name": "5.2 Tabular Listing of all Clinical Studies", "description": "Clinical study listings"},
+                {
+                    "name": "5.3 Clinical Study Reports and Related Information",
+                    "children": [
+                        {
+                            "name": "5.3.1 Reports of Biopharmaceutic Studies",
+                            "children": [
+                                {"name": "5.3.1.1 Bioavailability (BA) Study Reports", "description": "Bioavailability studies"},
+                                {"name": "5.3.1.2 Comparative BA and BE Study Reports", "description": "Comparative BA/BE studies"},
+                                {"name": "5.3.1.3 In Vitro - In Vivo Correlation", "description": "IVIVC studies"},
+                                {"name": "5.3.1.4 Bioanalytical Methods", "description": "Bioanalytical methods"}
+                            ]
+                        },
+                        {
+                            "name": "5.3.2 Reports of Studies Pertinent to Pharmacokinetics",
+                            "children": [
+                                {"name": "5.3.2.1 Plasma Protein Binding", "description": "Plasma protein binding"},
+                                {"name": "5.3.2.2 Hepatic Metabolism and Drug Interaction", "description": "Hepatic metabolism"},
+                                {"name": "5.3.2.3 Other Human Biomaterials", "description": "Other biomaterial studies"}
+                            ]
+                        },
+                        {
+                            "name": "5.3.3 Reports of Human Pharmacokinetic Studies",
+                            "children": [
+                                {"name": "5.3.3.1 Healthy Subject PK", "description": "Healthy subject PK"},
+                                {"name": "5.3.3.2 Patient PK", "description": "Patient PK studies"},
+                                {"name": "5.3.3.3 Intrinsic Factor PK", "description": "Intrinsic factor PK"},
+                                {"name": "5.3.3.4 Extrinsic Factor PK", "description": "Extrinsic factor PK"},
+                                {"name": "5.3.3.5 Population PK", "description": "Population PK"}
+                            ]
+                        },
+                        {
+                            "name": "5.3.4 Reports of Human Pharmacodynamic Studies",
+                            "children": [
+                                {"name": "5.3.4.1 Healthy Subject PD", "description": "Healthy subject PD"},
+                                {"name": "5.3.4.2 Patient PD", "description": "Patient PD studies"}
+                            ]
+                        },
+                        {
+                            "name": "5.3.5 Reports of Efficacy and Safety Studies",
+                            "children": [
+                                {"name": "5.3.5.1 Controlled Clinical Studies", "description": "Controlled studies"},
+                                {"name": "5.3.5.2 Uncontrolled Clinical Studies", "description": "Uncontrolled studies"},
+                                {"name": "5.3.5.3 Analyses from Multiple Studies", "description": "Multi-study analyses"},
+                                {"name": "5.3.5.4 Other Study Reports", "description": "Other clinical reports"}
+                            ]
+                        }
+                    ]
+                },
+                {"name": "5.4 Literature References", "description": "Clinical literature references"}
+            ]
+        }
+    ]
+}
+
+def _to_node(node):
+    """Convert a dict-based CTD definition into Node tuples, dropping descriptions"""
+    children = node.get("children") or ()
+    return Node(sys.intern(node.get("name", "")), tuple(_to_node(child) for child in children if isinstance(child, dict)))
+
+# Skeleton of the definition for the folder creation walk: names and children
+# only, since descriptions are written to the JSON file but never used for mkdir
+_CTD_NODES = _to_node(CTD_STRUCTURE)
 
 def create_complete_ctd_structure():
     """Create the most comprehensive CTD structure possible"""
@@ -19,486 +369,219 @@ def create_complete_ctd_structure():
     print("CREATING COMPLETE CTD FOLDER STRUCTURE")
     print("=" * 60)
     
-    # Define the most comprehensive CTD structure
-    complete_ctd_structure = {
-        "name": "CTD Structure",
-        "description": "Common Technical Document Structure",
-        "children": [
-            {
-                "name": "Module 1 Administrative Information and Prescribing Information",
-                "description": "Administrative documents and product information",
-                "children": [
-                    {
-                        "name": "1.0 Correspondence",
-                        "children": [
-                            {"name": "1.0.1 Cover Letter", "description": "Cover letters and introductory documents"},
-                            {"name": "1.0.2 General Note to Reviewer", "description": "Notes to regulatory reviewers"},
-                            {"name": "1.0.3 Life Cycle Management Tracking Table", "description": "Life cycle management documents"},
-                            {"name": "1.0.4 Correspondence Issued by Regulatory Authority", "description": "Regulatory authority correspondence"},
-                            {"name": "1.0.5 Response to Information Solicited by Regulatory Authority", "description": "Responses to regulatory queries"},
-                            {"name": "1.0.6 Meeting Information", "description": "Meeting minutes and notes"},
-                            {"name": "1.0.7 Request for Appeal Documentation", "description": "Appeal documentation"}
-                        ]
-                    },
-                    {
-                        "name": "1.2 Administrative Information",
-                        "children": [
-                            {"name": "1.2.1 Application Form", "description": "Regulatory application forms"},
-                            {"name": "1.2.2 Fee Forms", "description": "Fee payment forms"},
-                            {"name": "1.2.3 Certification and Attestation Forms", "description": "Certification documents"},
-                            {"name": "1.2.4 Compliance and Site Information", "description": "Site compliance information"},
-                            {"name": "1.2.5 Authorization for Sharing Information", "description": "Information sharing authorizations"},
-                            {"name": "1.2.6 Electronic Declaration", "description": "Electronic declarations"},
-                            {"name": "1.2.7 Trademark & Intellectual Property Information", "description": "Trademark and IP documents"},
-                            {"name": "1.2.8 Screening Details", "description": "Screening information"},
-                            {"name": "1.2.A Additional Administrative Information", "description": "Additional administrative documents"}
-                        ]
-                    },
-                    {
-                        "name": "1.3 Product Information",
-                        "children": [
-                            {
-                                "name": "1.3.1 Summary of Product Characteristics (SmPC)",
-                                "children": [
-                                    {
-                                        "name": "1.3.1.1 Approved - SmPC",
-                                        "children": [
-                                            {"name": "1.3.1.1.1 Approved - SmPC - English"},
-                                            {"name": "1.3.1.1.2 Approved - SmPC - French"},
-                                            {"name": "1.3.1.1.3 Approved - SmPC - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.1.2 Clean - SmPC",
-                                        "children": [
-                                            {"name": "1.3.1.2.1 Clean - SmPC - English"},
-                                            {"name": "1.3.1.2.2 Clean - SmPC - French"},
-                                            {"name": "1.3.1.2.3 Clean - SmPC - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.1.3 Annotated - SmPC",
-                                        "children": [
-                                            {"name": "1.3.1.3.1 Annotated - SmPC - English"},
-                                            {"name": "1.3.1.3.2 Annotated - SmPC - French"},
-                                            {"name": "1.3.1.3.3 Annotated - SmPC - Portuguese"}
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "name": "1.3.2 Patient Information Leaflet (PIL)",
-                                "children": [
-                                    {
-                                        "name": "1.3.2.1 Approved - PIL",
-                                        "children": [
-                                            {"name": "1.3.2.1.1 Approved - PIL - English"},
-                                            {"name": "1.3.2.1.2 Approved - PIL - French"},
-                                            {"name": "1.3.2.1.3 Approved - PIL - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.2.2 Clean - PIL",
-                                        "children": [
-                                            {"name": "1.3.2.2.1 Clean - PIL - English"},
-                                            {"name": "1.3.2.2.2 Clean - PIL - French"},
-                                            {"name": "1.3.2.2.3 Clean - PIL - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.2.3 Annotated - PIL",
-                                        "children": [
-                                            {"name": "1.3.2.3.1 Annotated - PIL - English"},
-                                            {"name": "1.3.2.3.2 Annotated - PIL - French"},
-                                            {"name": "1.3.2.3.3 Annotated - PIL - Portuguese"}
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "name": "1.3.3 Container Labels",
-                                "children": [
-                                    {
-                                        "name": "1.3.3.1 Approved - Container Labels",
-                                        "children": [
-                                            {"name": "1.3.3.1.1 Approved - Container Labels - English"},
-                                            {"name": "1.3.3.1.2 Approved - Container Labels - French"},
-                                            {"name": "1.3.3.1.3 Approved - Container Labels - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.3.2 Clean - Container Labels",
-                                        "children": [
-                                            {"name": "1.3.3.2.1 Clean - Container Labels - English"},
-                                            {"name": "1.3.3.2.2 Clean - Container Labels - French"},
-                                            {"name": "1.3.3.2.3 Clean - Container Labels - Portuguese"}
-                                        ]
-                                    },
-                                    {
-                                        "name": "1.3.3.3 Annotated - Container Labels",
-                                        "children": [
-                                            {"name": "1.3.3.3.1 Annotated - Container Labels - English"},
-                                            {"name": "1.3.3.3.2 Annotated - Container Labels - French"},
-                                            {"name": "1.3.3.3.3 Annotated - Container Labels - Portuguese"}
-                                        ]
-                                    }
-                                ]
-                            },
-                            {"name": "1.3.4 Foreign Labelling", "description": "Foreign labeling documents"},
-                            {"name": "1.3.5 Reference Product Labelling", "description": "Reference product labeling"},
-                            {"name": "1.3.6 Artwork and Samples", "description": "Artwork and sample documentation"}
-                        ]
-                    },
-                    {
-                        "name": "1.4 Information about the Experts",
-                        "children": [
-                            {"name": "1.4.1 Quality", "description": "Quality expert information"},
-                            {"name": "1.4.2 Non-Clinical", "description": "Non-clinical expert information"},
-                            {"name": "1.4.3 Clinical", "description": "Clinical expert information"}
-                        ]
-                    },
-                    {
-                        "name": "1.5 Specific Requirements for Different Types of Applications",
-                        "children": [
-                            {"name": "1.5.1 Bioequivalence Trial Information", "description": "Bioequivalence trial documentation"}
-                        ]
-                    },
-                    {
-                        "name": "1.6 Environmental Risk Assessment",
-                        "children": [
-                            {"name": "1.6.1 Non-GMO", "description": "Non-GMO documentation"},
-                            {"name": "1.6.2 GMO", "description": "GMO documentation"}
-                        ]
-                    },
-                    {
-                        "name": "1.7 Good Manufacturing Practice (GMP)",
-                        "children": [
-                            {"name": "1.7.1 Date of Inspection of Each Site", "description": "Site inspection dates"},
-                            {"name": "1.7.2 Inspection Reports or Equivalent Documents", "description": "Inspection reports"},
-                            {"name": "1.7.3 GMP Certificates or Manufacturing Licences", "description": "GMP certificates"},
-                            {"name": "1.7.4 Other GMP Documents", "description": "Other GMP documentation"}
-                        ]
-                    },
-                    {
-                        "name": "1.8 Information Relating to Pharmacovigilance",
-                        "children": [
-                            {"name": "1.8.1 Pharmacovigilance System", "description": "Pharmacovigilance system documentation"},
-                            {"name": "1.8.2 Risk-management System", "description": "Risk management documentation"}
-                        ]
-                    },
-                    {"name": "1.9 Individual Patient Data - Statement of Availability", "description": "Patient data availability statements"},
-                    {
-                        "name": "1.10 Foreign Regulatory Information",
-                        "children": [
-                            {"name": "1.10.1 Regional & Foreign Regulatory Status", "description": "Regulatory status information"},
-                            {"name": "1.10.2 WHO Type Certificate of Pharmaceutical Product (COPP)", "description": "WHO certificates"},
-                            {"name": "1.10.3 Data Set Similarities and Differences", "description": "Data set comparisons"},
-                            {"name": "1.10.4 Foreign Evaluation Reports", "description": "Foreign evaluation reports"}
-                        ]
-                    },
-                    {
-                        "name": "1.A Additional Data",
-                        "children": [
-                            {"name": "1.A.1 Country Specific Data", "description": "Country-specific documentation"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Module 2 Common Technical Document Summaries",
-                "description": "CTD summaries and overviews",
-                "children": [
-                    {"name": "2.2 Introduction to Summary", "description": "Summary introduction"},
-                    {
-                        "name": "2.3 Quality Overall Summary (QOS)",
-                        "children": [
-                            {"name": "2.3 Introduction", "description": "QOS introduction"},
-                            {"name": "2.3.S Drug Substance", "description": "Drug substance summary"},
-                            {"name": "2.3.P Drug Product", "description": "Drug product summary"},
-                            {"name": "2.3.A Appendices", "description": "QOS appendices"},
-                            {"name": "2.3.R Regional Information", "description": "Regional information"}
-                        ]
-                    },
-                    {"name": "2.4 Nonclinical Overview", "description": "Nonclinical overview"},
-                    {"name": "2.5 Clinical Overview", "description": "Clinical overview"},
-                    {
-                        "name": "2.6 NonClinical Written and Tabulated Summaries",
-                        "children": [
-                            {"name": "2.6.1 Introduction", "description": "Nonclinical summaries introduction"},
-                            {"name": "2.6.2 Pharmacology Written Summary", "description": "Pharmacology written summary"},
-                            {"name": "2.6.3 Pharmacology Tabulated Summary", "description": "Pharmacology tabulated summary"},
-                            {"name": "2.6.4 Pharmacokinetics Written Summary", "description": "PK written summary"},
-                            {"name": "2.6.5 Pharmacokinetics Tabulated Summary", "description": "PK tabulated summary"},
-                            {"name": "2.6.6 Toxicology Written Summary", "description": "Toxicology written summary"},
-                            {"name": "2.6.7 Toxicology Tabulated Summary", "description": "Toxicology tabulated summary"}
-                        ]
-                    },
-                    {
-                        "name": "2.7 Clinical Summary",
-                        "children": [
-                            {"name": "2.7.1 Summary of Biopharmaceutic Studies", "description": "Biopharmaceutics summary"},
-                            {"name": "2.7.2 Summary of Clinical Pharmacology Studies", "description": "Clinical pharmacology summary"},
-                            {"name": "2.7.3 Summary of Clinical Efficacy", "description": "Clinical efficacy summary"},
-                            {"name": "2.7.4 Summary of Clinical Safety", "description": "Clinical safety summary"},
-                            {"name": "2.7.5 References", "description": "Clinical references"},
-                            {"name": "2.7.6 Synopses of Individual Studies", "description": "Study synopses"}
-                        ]
-                    }
-                ]
-            },
-            {
-                "name": "Module 3 Quality",
-                "description": "Quality documentation",
-                "children": [
-                    {
-                        "name": "3.2 Body of Data",
-                        "children": [
-                            {
-                                "name": "3.2.S Drug Substance",
-                                "children": [
-                                    {
-                                        "name": "3.2.S.1 General Information",
-                                        "children": [
-                                            {"name": "3.2.S.1.1 Nomenclature", "description": "Drug substance nomenclature"},
-                                            {"name": "3.2.S.1.2 Structure", "description": "Drug substance structure"},
-                                            {"name": "3.2.S.1.3 General Properties", "description": "Drug substance properties"}
-                                        ]
-                                    },
-                                    {"name": "3.2.S.2 Manufacture", "description": "Drug substance manufacture"},
-                                    {"name": "3.2.S.3 Characterization", "description": "Drug substance characterization"},
-                                    {"name": "3.2.S.4 Control of Drug Substance", "description": "Drug substance control"},
-                                    {"name": "3.2.S.5 Reference Standards or Materials", "description": "Reference standards"},
-                                    {"name": "3.2.S.6 Container Closure Systems", "description": "Container closure systems"},
-                                    {"name": "3.2.S.7 Stability", "description": "Drug substance stability"}
-                                ]
-                            },
-                            {
-                                "name": "3.2.P Drug Product",
-                                "children": [
-                                    {"name": "3.2.P.1 Description and Composition", "description": "Drug product description"},
-                                    {"name": "3.2.P.2 Pharmaceutical Development", "description": "Pharmaceutical development"},
-                                    {"name": "3.2.P.3 Manufacture", "description": "Drug product manufacture"},
-                                    {"name": "3.2.P.4 Control of Excipients", "description": "Excipient control"},
-                                    {"name": "3.2.P.5 Control of Drug Product", "description": "Drug product control"},
-                                    {"name": "3.2.P.6 Reference Standards or Materials", "description": "Reference standards"},
-                                    {"name": "3.2.P.7 Container Closure System", "description": "Container closure system"},
-                                    {"name": "3.2.P.8 Stability", "description": "Drug product stability"}
-                                ]
-                            }
-                        ]
-                    },
-                    {"name": "3.3 Literature References", "description": "Quality literature references"}
-                ]
-            },
-            {
-                "name": "Module 4 Nonclinical Study Reports",
-                "description": "Nonclinical study documentation",
-                "children": [
-                    {
-                        "name": "4.2 Study Reports",
-                        "children": [
-                            {
-                                "name": "4.2.1 Pharmacology",
-                                "children": [
-                                    {"name": "4.2.1.1 Primary Pharmacodynamics", "description": "Primary pharmacology studies"},
-                                    {"name": "4.2.1.2 Secondary Pharmacodynamics", "description": "Secondary pharmacology studies"},
-                                    {"name": "4.2.1.3 Safety Pharmacology", "description": "Safety pharmacology studies"},
-                                    {"name": "4.2.1.4 Pharmacodynamic Drug Interactions", "description": "Pharmacodynamic interactions"}
-                                ]
-                            },
-                            {
-                                "name": "4.2.2 Pharmacokinetics",
-                                "children": [
-                                    {"name": "4.2.2.1 Analytical Methods and Validation", "description": "Analytical methods"},
-                                    {"name": "4.2.2.2 Absorption", "description": "Absorption studies"},
-                                    {"name": "4.2.2.3 Distribution", "description": "Distribution studies"},
-                                    {"name": "4.2.2.4 Metabolism", "description": "Metabolism studies"},
-                                    {"name": "4.2.2.5 Excretion", "description": "Excretion studies"},
-                                    {"name": "4.2.2.6 Pharmacokinetic Drug Interactions", "description": "PK interactions"},
-                                    {"name": "4.2.2.7 Other Pharmacokinetic Studies", "description": "Other PK studies"}
-                                ]
-                            },
-                            {
-                                "name": "4.2.3 Toxicology",
-                                "children": [
-                                    {"name": "4.2.3.1 Single-Dose Toxicity", "description": "Single-dose toxicity"},
-                                    {"name": "4.2.3.2 Repeat-Dose Toxicity", "description": "Repeat-dose toxicity"},
-                                    {"name": "4.2.3.3 Genotoxicity", "description": "Genotoxicity studies"},
-                                    {"name": "4.2.3.4 Carcinogenicity", "description": "Carcinogenicity studies"},
-                                    {"name": "4.2.3.5 Reproductive and Developmental Toxicity", "description": "Reproductive toxicity"},
-                                    {"name": "4.2.3.6 Local Tolerance", "description": "Local tolerance studies"},
-                                    {"name": "4.2.3.7 Other Toxicity Studies", "description": "Other toxicity studies"}
-                                ]
-                            }
-                        ]
-                    },
-                    {"name": "4.3 Literature References", "description": "Nonclinical literature references"}
-                ]
-            },
-            {
-                "name": "Module 5 Clinical Study Reports",
-                "description": "Clinical study documentation",
-                "children": [
-                    {"name": "5.2 Tabular Listing of all Clinical Studies", "description": "Clinical study listings"},
-                    {
-                        "name": "5.3 Clinical Study Reports and Related Information",
-                        "children": [
-                            {
-                                "name": "5.3.1 Reports of Biopharmaceutic Studies",
-                                "children": [
-                                    {"name": "5.3.1.1 Bioavailability (BA) Study Reports", "description": "Bioavailability studies"},
-                                    {"name": "5.3.1.2 Comparative BA and BE Study Reports", "description": "Comparative BA/BE studies"},
-                                    {"name": "5.3.1.3 In Vitro - In Vivo Correlation", "description": "IVIVC studies"},
-                                    {"name": "5.3.1.4 Bioanalytical Methods", "description": "Bioanalytical methods"}
-                                ]
-                            },
-                            {
-                                "name": "5.3.2 Reports of Studies Pertinent to Pharmacokinetics",
-                                "children": [
-                                    {"name": "5.3.2.1 Plasma Protein Binding", "description": "Plasma protein binding"},
-                                    {"name": "5.3.2.2 Hepatic Metabolism and Drug Interaction", "description": "Hepatic metabolism"},
-                                    {"name": "5.3.2.3 Other Human Biomaterials", "description": "Other biomaterial studies"}
-                                ]
-                            },
-                            {
-                                "name": "5.3.3 Reports of Human Pharmacokinetic Studies",
-                                "children": [
-                                    {"name": "5.3.3.1 Healthy Subject PK", "description": "Healthy subject PK"},
-                                    {"name": "5.3.3.2 Patient PK", "description": "Patient PK studies"},
-                                    {"name": "5.3.3.3 Intrinsic Factor PK", "description": "Intrinsic factor PK"},
-                                    {"name": "5.3.3.4 Extrinsic Factor PK", "description": "Extrinsic factor PK"},
-                                    {"name": "5.3.3.5 Population PK", "description": "Population PK"}
-                                ]
-                            },
-                            {
-                                "name": "5.3.4 Reports of Human Pharmacodynamic Studies",
-                                "children": [
-                                    {"name": "5.3.4.1 Healthy Subject PD", "description": "Healthy subject PD"},
-                                    {"name": "5.3.4.2 Patient PD", "description": "Patient PD studies"}
-                                ]
-                            },
-                            {
-                                "name": "5.3.5 Reports of Efficacy and Safety Studies",
-                                "children": [
-                                    {"name": "5.3.5.1 Controlled Clinical Studies", "description": "Controlled studies"},
-                                    {"name": "5.3.5.2 Uncontrolled Clinical Studies", "description": "Uncontrolled studies"},
-                                    {"name": "5.3.5.3 Analyses from Multiple Studies", "description": "Multi-study analyses"},
-                                    {"name": "5.3.5.4 Other Study Reports", "description": "Other clinical reports"}
-                                ]
-                            }
-                        ]
-                    },
-                    {"name": "5.4 Literature References", "description": "Clinical literature references"}
-                ]
-            }
-        ]
-    }
-    
-    # Save to JSON file
-    with open(CTD_STRUCTURE_FILE, 'w') as f:
-        json.dump(complete_ctd_structure, f, indent=2)
-    
-    print(f"Saved complete CTD structure to: {CTD_STRUCTURE_FILE}")
+    new_bytes = _structure_bytes()
+    
+    # Skip the rebuild if a previous run built this exact structure
+    total_folders = _current_build(new_bytes)
+    if total_folders is not None:
+        print(f"CTD structure already built in: {OUTPUT_FOLDER}")
+        return total_folders
+    
+    # Save to JSON file, skipping the write when the content is unchanged
+    if _read_bytes(CTD_STRUCTURE_FILE) == new_bytes:
+        print(f"CTD structure unchanged: {CTD_STRUCTURE_FILE}")
+    else:
+        with open(CTD_STRUCTURE_FILE, 'wb') as f:
+            f.write(new_bytes)
+        print(f"Saved complete CTD structure to: {CTD_STRUCTURE_FILE}")
     
     # Create the folder structure WITHOUT README files
-    total_folders = create_folder_structure(complete_ctd_structure, OUTPUT_FOLDER)
+    total_folders, modules = create_folder_structure(_CTD_NODES, OUTPUT_FOLDER)
+    
+    # Record the successful build, and what it was built from, for the fast path above
+    with open(os.path.join(OUTPUT_FOLDER, BUILD_MARKER), 'w') as f:
+        f.write(f"{_structure_digest(new_bytes)} {total_folders}")
     
     print(f"\nCreated {total_folders} CTD folders in: {OUTPUT_FOLDER}")
     print("=" * 60)
     
-    # Show structure summary
-    show_structure_summary(OUTPUT_FOLDER)
+    # Show structure summary from the counts gathered during creation
+    show_structure_summary(OUTPUT_FOLDER, total_folders, modules)
     
     return total_folders
 
-def create_folder_structure(node, base_path):
-    """Recursively create folder structure from CTD definition"""
-    folder_count = 0
+def _read_bytes(file_path):
+    """Read a file's bytes, or None if it does not exist"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+def _structure_bytes():
+    """Serialize CTD_STRUCTURE as written to CTD_STRUCTURE_FILE"""
+    if orjson is not None:
+        return orjson.dumps(CTD_STRUCTURE, option=orjson.OPT_INDENT_2)
+    return json.dumps(CTD_STRUCTURE, indent=2).encode()
+
+def _structure_digest(structure_bytes):
+    """Fingerprint of a serialized structure, stored in the build marker"""
+    return hashlib.blake2b(structure_bytes, digest_size=16).hexdigest()
+
+def _read_build_marker(marker_path):
+    """Read the (digest, folder count) stored by a previous build, or None if unreadable"""
+    try:
+        with open(marker_path, 'r') as f:
+            digest, total_folders = f.read().split()
+            return digest, int(total_folders)
+    except (OSError, ValueError):
+        return None
+
+def _top_level_paths():
+    """Paths of the folders directly below the CTD root, e.g. the Module folders"""
+    root_path = OUTPUT_FOLDER + _SEP + clean_folder_name(_CTD_NODES.name)
+    return [root_path + _SEP + clean_folder_name(child.name) for child in _CTD_NODES.children if child.name]
+
+def _current_build(structure_bytes):
+    """Folder count of a previous build of this exact structure, or None if a rebuild is needed"""
+    marker = _read_build_marker(os.path.join(OUTPUT_FOLDER, BUILD_MARKER))
+    if marker is None:
+        return None
     
-    if not isinstance(node, dict):
-        return folder_count
+    digest, total_folders = marker
+    if digest != _structure_digest(structure_bytes) or _read_bytes(CTD_STRUCTURE_FILE) != structure_bytes:
+        return None
     
-    node_name = node.get("name", "")
-    if not node_name:
-        return folder_count
+    # Cheap check that the tree was not removed since the marker was written
+    if not all(os.path.isdir(path) for path in _top_level_paths()):
+        return None
+    return total_folders
+
+def create_folder_structure(node, base_path):
+    """Create folder structure from CTD definition with one mkdir per folder
     
-    # Clean folder name (remove invalid characters)
-    folder_name = clean_folder_name(node_name)
+    node may be a Node or a dict-based definition. Returns (folder_count,
+    modules) where modules lists the Module folders directly below the root.
+    """
+    if isinstance(node, dict):
+        node = _to_node(node)
     
-    # Create folder path
-    folder_path = os.path.join(base_path, folder_name)
+    folder_paths = []
+    modules = []
+    folder_count = _collect_paths(node, base_path, folder_paths, modules)
     
-    # Create the folder
-    os.makedirs(folder_path, exist_ok=True)
-    folder_count += 1
+    # Only the output root may need intermediate parents
+    os.makedirs(base_path, exist_ok=True)
     
-    # REMOVED: Don't create README files
+    unique_paths = set(folder_paths)
     
-    # Process children
-    children = node.get("children", [])
-    if children and isinstance(children, list):
-        for child in children:
-            folder_count += create_folder_structure(child, folder_path)
+    # On POSIX, a single `mkdir -p` process creates every folder at once
+    if os.name == 'posix':
+        try:
+            subprocess.run(['mkdir', '-p', '--', *sorted(path for _, path in unique_paths)], check=True)
+            return folder_count, modules
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"mkdir -p failed ({e}), creating folders individually")
     
-    return folder_count
-
-def clean_folder_name(name):
-    """Clean folder name by removing invalid characters"""
-    # Remove invalid characters for Windows/Linux
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '-')
+    # Group unique paths by depth; folders at the same depth are independent
+    paths_by_depth = defaultdict(list)
+    for depth, folder_path in unique_paths:
+        paths_by_depth[depth].append(folder_path)
     
-    # Remove multiple spaces and trim
-    name = ' '.join(name.split())
+    # Create one depth level at a time so parents exist before children
+    with ThreadPoolExecutor(max_workers=MKDIR_WORKERS) as executor:
+        for depth in sorted(paths_by_depth):
+            list(executor.map(_safe_mkdir, paths_by_depth[depth]))
     
-    return name
-
-def show_structure_summary(base_path):
-    """Show summary of created structure"""
-    print("\nCTD STRUCTURE SUMMARY:")
-    print("=" * 60)
+    # REMOVED: Don't create README files
     
-    modules = []
-    total_folders = 0
+    return folder_count, modules
+
+def _safe_mkdir(folder_path):
+    """Create a single folder, ignoring folders that already exist"""
+    try:
+        os.mkdir(folder_path)
+    except FileExistsError:
+        pass
+
+def _collect_paths(node, base_path, out, modules):
+    """Collect (depth, path) pairs and module names from CTD definition without touching the disk"""
+    folder_count = 0
+    append = out.append
     
-    for root, dirs, files in os.walk(base_path):
-        level = root.replace(base_path, '').count(os.sep)
-        
-        if level == 0:
+    # Explicit stack instead of recursion: (node, parent path, depth)
+    stack = [(node, base_path, 0)]
+    push = stack.append
+    while stack:
+        current, parent_path, depth = stack.pop()
+        node_name = current.name
+        if not node_name:
             continue
         
-        folder_name = os.path.basename(root)
+        # Clean folder name (remove invalid characters)
+        folder_name = clean_folder_name(node_name)
+        # Names are already cleaned, so plain concatenation is safe
+        folder_path = parent_path + _SEP + folder_name
+        append((depth, folder_path))
+        folder_count += 1
         
-        if level == 1 and folder_name.startswith("Module"):
+        if depth == 1 and folder_name.startswith("Module"):
             modules.append(folder_name)
         
-        if dirs or files:
-            total_folders += 1
+        # Process children (reversed so they are popped in definition order)
+        for child in reversed(current.children):
+            push((child, folder_path, depth + 1))
     
-    print(f"Total Modules: {len(modules)}")
+    return folder_count
+
+@lru_cache(maxsize=None)
+def clean_folder_name(name):
+    """Clean folder name by removing invalid characters"""
+    # Replace invalid characters in a single pass, then
+    # remove multiple spaces and trim
+    return ' '.join(name.translate(_INVALID_TRANS).split())
+
+def show_structure_summary(base_path, total_folders, modules):
+    """Show summary of created structure from pre-computed counts"""
+    # Collect all output lines and emit them with a single write
+    buf = ["\nCTD STRUCTURE SUMMARY:\n", "=" * 60 + "\n"]
+    
+    buf.append(f"Total Modules: {len(modules)}\n")
     for i, module in enumerate(modules, 1):
-        print(f"   {i}. {module}")
+        buf.append(f"   {i}. {module}\n")
     
-    print(f"\nTotal Folders Created: {total_folders}")
-    print(f"Location: {os.path.abspath(base_path)}")
+    buf.append(f"\nTotal Folders Created: {total_folders}\n")
+    buf.append(f"Location: {os.path.abspath(base_path)}\n")
     
     # Show folder tree (first 3 levels)
-    print("\nFOLDER TREE (First 3 levels):")
-    print_tree(base_path, max_depth=3)
+    buf.append("\nFOLDER TREE (First 3 levels):\n")
+    _format_tree(_build_tree(base_path, 3), "", 0, buf)
+    
+    sys.stdout.write(''.join(buf))
 
 def print_tree(start_path, prefix="", is_last=True, max_depth=3, current_depth=0):
     """Print folder tree structure with folder icons"""
-    if current_depth >= max_depth:
-        return
+    buf = []
+    tree = _build_tree(start_path, max_depth - current_depth)
+    _format_tree(tree, prefix, current_depth, buf)
+    sys.stdout.write(''.join(buf))
+
+def _build_tree(base_path, max_depth):
+    """Read folder names below base_path into nested dicts, max_depth levels deep"""
+    tree = {}
+    if max_depth <= 0:
+        return tree
     
-    items = []
-    try:
-        items = [item for item in os.listdir(start_path) if os.path.isdir(os.path.join(start_path, item))]
-    except:
-        return
+    # Breadth-first scandir walk; DirEntry carries the type, so no extra stat
+    queue = deque([(base_path, tree, 1)])
+    while queue:
+        path, subtree, depth = queue.popleft()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        child = subtree[entry.name] = {}
+                        # Stop at the depth limit without opening the child folder
+                        if depth < max_depth:
+                            queue.append((entry.path, child, depth + 1))
+        except (PermissionError, FileNotFoundError):
+            continue
     
-    items.sort()
+    return tree
+
+def _format_tree(tree, prefix, current_depth, buf):
+    """Append folder tree lines with folder icons to buf from an in-memory tree"""
+    items = sorted(tree)
     
     for i, item in enumerate(items):
         is_last_item = i == len(items) - 1
@@ -513,7 +596,7 @@ def print_tree(start_path, prefix="", is_last=True, max_depth=3, current_depth=0
             else:
                 connector = "├── 📁 "
         
-        print(f"{prefix}{connector}{item}")
+        buf.append(f"{prefix}{connector}{item}\n")
         
         # Create new prefix for next level
         if is_last_item:
@@ -521,7 +604,7 @@ def print_tree(start_path, prefix="", is_last=True, max_depth=3, current_depth=0
         else:
             new_prefix = prefix + "│   "
         
-        print_tree(os.path.join(start_path, item), new_prefix, is_last_item, max_depth, current_depth + 1)
+        _format_tree(tree[item], new_prefix, current_depth + 1, buf)
 
 def main():
     """Main function"""
@@ -536,24 +619,34 @@ def main():
         print("Operation cancelled.")
         return
     
-    # Clear existing organized_ctd if exists
+    # Clear existing organized_ctd if exists; an up-to-date build may be kept as is
+    keep_existing = False
     if os.path.exists(OUTPUT_FOLDER):
-        print(f"\n{OUTPUT_FOLDER} already exists.")
+        up_to_date = _current_build(_structure_bytes()) is not None
+        if up_to_date:
+            print(f"\n{OUTPUT_FOLDER} already exists and is up to date with the CTD definition.")
+        else:
+            print(f"\n{OUTPUT_FOLDER} already exists.")
         response = input("Delete and recreate? (yes/no): ")
         
         if response.lower() in ['yes', 'y']:
             shutil.rmtree(OUTPUT_FOLDER)
             print(f"Deleted existing {OUTPUT_FOLDER}")
+        elif up_to_date:
+            keep_existing = True
         else:
             print("Operation cancelled.")
             return
     
-    # Create the structure
-    total_folders = create_complete_ctd_structure()
-    
-    print(f"\nCTD structure creation complete!")
-    print(f"{total_folders} folders created in {OUTPUT_FOLDER}")
-    print(f"CTD definition saved to {CTD_STRUCTURE_FILE}")
+    if keep_existing:
+        print(f"\nKept the existing CTD structure in {OUTPUT_FOLDER}")
+    else:
+        # Create the structure
+        total_folders = create_complete_ctd_structure()
+        
+        print(f"\nCTD structure creation complete!")
+        print(f"{total_folders} folders created in {OUTPUT_FOLDER}")
+        print(f"CTD definition saved to {CTD_STRUCTURE_FILE}")
     
     print("\nNEXT STEPS:")
     print("1. Add your PDF documents to 'documents_to_organize' folder")
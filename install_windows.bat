@@ -12,7 +12,7 @@ pip install torch torchvision torchaudio --index-url https://download.pytorch.or
 
 REM Step 2: Install basic requirements
 echo Installing basic dependencies...
-pip install PyPDF2 pdfplumber numpy pandas colorama tqdm psutil
+pip install PyPDF2 pdfplumber pymupdf numpy pandas colorama tqdm psutil
 
 REM Step 3: Install transformers without problematic dependencies
 echo Installing transformers...
@@ -20,7 +20,7 @@ pip install transformers==4.36.2 accelerate==0.25.0 sentence-transformers==2.2.2
 
 REM Step 4: Install remaining packages
 echo Installing additional packages...
-pip install python-json-logger protobuf scikit-learn
+pip install python-json-logger protobuf scikit-learn orjson pyahocorasick
 
 echo.
 echo ✅ Installation complete!
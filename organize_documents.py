@@ -8,12 +8,36 @@ import os
 import re
 import json
 import shutil
-import hashlib
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import PyPDF2
 import pdfplumber
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional, Set
 import logging
+from create_ctd_structure import CTD_STRUCTURE
+
+# Optional fast PDF text extractor (PyMuPDF); pdfplumber/PyPDF2 remain fallbacks
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # PyMuPDF releases before the pymupdf module name
+    except ImportError:
+        fitz = None
+
+# Optional fast JSON encoder/decoder; falls back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional multi-pattern keyword matcher; falls back to per-keyword scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Configuration
 CTD_STRUCTURE_FILE = "ctd_structure.json"
@@ -32,6 +56,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Pre-compiled CTD section patterns, shared by every PDF and tree node
+_CTD_SECTION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    r'\b(?:ctd|module)\s*(?:section)?\s*[:]?\s*([0-9]+(?:\.[0-9]+)+)\b',
+    r'\bsection\s*([0-9]+(?:\.[0-9]+)+)\b',
+    r'\b([0-9]+\.[0-9]+(?:\.[0-9]+)*)\b'
+])
+_SECTION_NUM_RE = re.compile(r'(\d+(?:\.\d+)*)')
+
+# Invalid folder name characters, replaced with '-' in a single pass
+_FOLDER_TRANS = str.maketrans({char: '-' for char in '<>:"/\\|?*'})
+
 # Enhanced Keywords mapping for CTD sections with precise folder targeting
 CTD_KEYWORDS = {
     # Module 1 - Correspondence
@@ -113,109 +148,225 @@ CTD_KEYWORDS = {
     "5.3.5 Reports of Efficacy and Safety Studies": ["efficacy", "effectiveness", "clinical efficacy", "safety"],
 }
 
+# Tied keyword scores go to the folder listed first in CTD_KEYWORDS
+_KEYWORD_FOLDER_ORDER = {folder: i for i, folder in enumerate(CTD_KEYWORDS)}
+
+# Common patterns in filenames and the CTD folder each one points to
+_FILENAME_PATTERNS = (
+    (("cover letter", "cover-letter", "cover_letter", "emea-cover", "ema-cover"), "1.0.1 Cover Letter"),
+    (("application form", "application-form", "appform", "emea-form", "ema-form"), "1.2.1 Application Form"),
+    (("gmp certificate", "gmp-cert"), "1.7.3 GMP Certificates or Manufacturing Licences"),
+    (("smc", "summary of product"), "1.3.1 Summary of Product Characteristics (SmPC)"),
+    (("pil", "patient leaflet"), "1.3.2 Patient Information Leaflet (PIL)"),
+    (("clinical study", "study-report", "clinical-trial"), "5.3 Clinical Study Reports and Related Information"),
+    (("protocol", "study-protocol"), "5.3 Clinical Study Reports and Related Information"),
+    (("quality summary", "qos"), "2.3 Quality Overall Summary (QOS)"),
+    (("stability", "stability-study"), "3.2.P.8 Stability"),
+    (("specification", "spec"), "3.2.P.5 Control of Drug Product"),
+)
+
+# Filename patterns specific enough to classify a PDF before reading it; each
+# must match whole tokens, so "inspection" never counts as "spec"
+_FILENAME_FAST_PATTERNS = tuple(
+    (re.compile(r'(?<![a-z0-9])(?:' + pattern + r')(?![a-z0-9])'), folder_name)
+    for pattern, folder_name in (
+        (r'cover[\s_-]?letter|eme?a[\s_-]cover', "1.0.1 Cover Letter"),
+        (r'application[\s_-]?form|appform|eme?a[\s_-]form', "1.2.1 Application Form"),
+        (r'gmp[\s_-]?cert(?:ificate)?s?', "1.7.3 GMP Certificates or Manufacturing Licences"),
+        (r'summary[\s_-]of[\s_-]product[\s_-]characteristics', "1.3.1 Summary of Product Characteristics (SmPC)"),
+        (r'patient[\s_-](?:information[\s_-])?leaflet', "1.3.2 Patient Information Leaflet (PIL)"),
+        (r'quality[\s_-]overall[\s_-]summary', "2.3 Quality Overall Summary (QOS)"),
+    )
+)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over all CTD keywords (None if unavailable)"""
+    if ahocorasick is None:
+        return None
+    
+    # A keyword may be listed under more than one folder
+    keyword_folders = {}
+    for folder_name, keywords in CTD_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_folders.setdefault(keyword.lower(), []).append(folder_name)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, folders in keyword_folders.items():
+        automaton.add_word(_automaton_input(keyword), (keyword, tuple(folders)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _automaton_input(text: str):
+    """Encode lowercased text for the automaton (bytes builds scan bytes)"""
+    return text if _KEYWORD_AUTOMATON_UNICODE else text.encode('utf-8', 'ignore')
+
+# Standard pyahocorasick wheels are unicode builds; bytes builds have a tighter loop
+_KEYWORD_AUTOMATON_UNICODE = ahocorasick is None or bool(ahocorasick.unicode)
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _walk_ctd_structure(root: Dict, base_path: str):
+    """Yield (node, node_name, full_path) for every named node, depth first"""
+    stack = [(root, base_path)]
+    while stack:
+        node, current_path = stack.pop()
+        node_name = node.get("name", "")
+        if not node_name:
+            continue
+        folder_name = ' '.join(node_name.translate(_FOLDER_TRANS).split())
+        full_path = os.path.join(current_path, folder_name) if current_path else folder_name
+        yield node, node_name, full_path
+        
+        # Push children reversed so they are visited in document order
+        children = node.get("children")
+        if children:
+            stack.extend((child, full_path) for child in reversed(children))
+
 
 class PDFProcessor:
     """Process PDF files to extract information"""
     
     def __init__(self):
-        self.text_cache = {}
         self.folder_index = {}
     
-    def build_folder_index(self, ctd_structure: Dict, base_path: str = ""):
-        """Build an index of all CTD folders for quick lookup"""
-        folder_index = {}
+    def build_folder_index(self, ctd_structure: Dict, base_path: str = "",
+                           folder_index: Optional[Dict] = None):
+        """Build an index of all CTD folders for quick lookup
+        
+        A folder_index already built by the caller's own walk is used as is.
+        """
+        if folder_index is None:
+            folder_index = {}
+            for node, node_name, full_path in _walk_ctd_structure(ctd_structure, base_path):
+                self.index_folder(folder_index, node, node_name, full_path)
         
-        def index_node(node: Dict, current_path: str):
-            node_name = node.get("name", "")
-            if node_name:
-                folder_name = self._clean_folder_name(node_name)
-                full_path = os.path.join(current_path, folder_name) if current_path else folder_name
-                
-                # Index by full path
-                folder_index[full_path] = {
-                    "name": node_name,
-                    "path": full_path,
-                    "description": node.get("description", ""),
-                    "is_leaf": not node.get("children")
-                }
-                
-                # Also index by section numbers if present
-                section_match = re.search(r'(\d+(?:\.\d+)*)', node_name)
-                if section_match:
-                    section = section_match.group(1)
-                    folder_index[section] = {
-                        "name": node_name,
-                        "path": full_path,
-                        "description": node.get("description", ""),
-                        "is_leaf": not node.get("children")
-                    }
-                
-                # Index children
-                children = node.get("children", [])
-                for child in children:
-                    index_node(child, full_path)
-        
-        index_node(ctd_structure, base_path)
         self.folder_index = folder_index
         return folder_index
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF file"""
+    @staticmethod
+    def index_folder(folder_index: Dict, node: Dict, node_name: str, full_path: str,
+                     section_match=None):
+        """Add one CTD node to folder_index by full path and by section number"""
+        entry = {
+            "name": node_name,
+            "path": full_path,
+            "description": node.get("description", ""),
+            "is_leaf": not node.get("children")
+        }
+        folder_index[full_path] = entry
+        
+        # Also index by section numbers if present
+        if section_match is None:
+            section_match = _SECTION_NUM_RE.search(node_name)
+        if section_match:
+            folder_index[section_match.group(1)] = dict(entry)
+    
+    def extract_text_from_pdf(self, pdf_path: str, max_pages: Optional[int] = 8,
+                              max_chars: Optional[int] = 50000) -> str:
+        """Extract text from PDF file
+        
+        Classification only needs the first pages, so extraction stops after
+        max_pages pages or once max_chars characters have been read. Pass
+        None for either limit to read the whole document.
+        """
         try:
-            # Check cache first
-            pdf_hash = self._get_file_hash(pdf_path)
-            if pdf_hash in self.text_cache:
-                return self.text_cache[pdf_hash]
-            
             text = ""
             
-            # Try pdfplumber first (better for complex layouts)
-            try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
-            except Exception as e:
-                logger.warning(f"pdfplumber failed for {pdf_path}: {e}")
-                # Fallback to PyPDF2
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages:
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+            # Try PyMuPDF first (much faster for plain text)
+            if fitz is not None:
+                try:
+                    text = self._extract_with_pymupdf(pdf_path, max_pages, max_chars)
+                except Exception as e:
+                    logger.warning(f"PyMuPDF failed for {pdf_path}: {e}")
+                    text = ""
+            
+            # Fall back to pdfplumber (better for complex layouts), then PyPDF2
+            if not text.strip():
+                text = ""
+                try:
+                    # Only materialize the pages within the page budget
+                    pages = list(range(1, max_pages + 1)) if max_pages is not None else None
+                    with pdfplumber.open(pdf_path, pages=pages) as pdf:
+                        for i, page in enumerate(pdf.pages):
+                            if self._budget_reached(i, len(text), max_pages, max_chars):
+                                break
+                            page_text = page.extract_text()
+                            if page_text:
+                                text += page_text + "\n"
+                except Exception as e:
+                    logger.warning(f"pdfplumber failed for {pdf_path}: {e}")
+                    # Fallback to PyPDF2
+                    with open(pdf_path, 'rb') as file:
+                        pdf_reader = PyPDF2.PdfReader(file)
+                        for i, page in enumerate(pdf_reader.pages):
+                            if self._budget_reached(i, len(text), max_pages, max_chars):
+                                break
+                            page_text = page.extract_text()
+                            if page_text:
+                                text += page_text + "\n"
             
-            # Cache the result
-            self.text_cache[pdf_hash] = text
             return text
             
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return ""
     
+    def _extract_with_pymupdf(self, pdf_path: str, max_pages: Optional[int],
+                              max_chars: Optional[int]) -> str:
+        """Extract plain text with PyMuPDF within the page and character budget"""
+        text = ""
+        with fitz.open(pdf_path) as doc:
+            for i, page in enumerate(doc):
+                if self._budget_reached(i, len(text), max_pages, max_chars):
+                    break
+                page_text = page.get_text()
+                if page_text:
+                    text += page_text + "\n"
+        return text
+    
+    @staticmethod
+    def _budget_reached(page_index: int, text_length: int, max_pages: Optional[int],
+                        max_chars: Optional[int]) -> bool:
+        """Check whether the page or character budget for extraction is used up"""
+        return ((max_pages is not None and page_index >= max_pages) or
+                (max_chars is not None and text_length >= max_chars))
+    
     def analyze_content(self, text: str, filename: str = "") -> Dict:
         """Analyze PDF content to determine CTD section"""
         text_lower = text.lower()
         filename_lower = filename.lower() if filename else ""
         
-        # Initialize scores for each CTD folder
-        scores = {folder: 0 for folder in CTD_KEYWORDS}
-        
-        # Score based on keywords in text
-        for folder_name, keywords in CTD_KEYWORDS.items():
-            for keyword in keywords:
-                keyword_lower = keyword.lower()
-                
-                # Check in text
-                if keyword_lower in text_lower:
-                    # Count occurrences with weight
+        # Only folders that actually score get an entry
+        scores = Counter()
+        
+        if _KEYWORD_AUTOMATON is not None:
+            # Single pass over the text: every keyword occurrence adds weight
+            for _, (keyword, folders) in _KEYWORD_AUTOMATON.iter(_automaton_input(text_lower)):
+                for folder_name in folders:
+                    scores[folder_name] += 5
+            
+            # Filename: each keyword counts once, however often it appears
+            if filename:
+                filename_matches = _KEYWORD_AUTOMATON.iter(_automaton_input(filename_lower))
+                for keyword, folders in {match for _, match in filename_matches}:
+                    for folder_name in folders:
+                        scores[folder_name] += 50
+        else:
+            # Score based on keywords in text
+            for folder_name, keywords in CTD_KEYWORDS.items():
+                for keyword in keywords:
+                    keyword_lower = keyword.lower()
+                    
+                    # Count occurrences with weight; a zero count means absent
                     count = text_lower.count(keyword_lower)
-                    scores[folder_name] += count * 5
-                
-                # Check in filename
-                if filename and keyword_lower in filename_lower:
-                    scores[folder_name] += 50
+                    if count:
+                        scores[folder_name] += count * 5
+                    
+                    # Check in filename
+                    if filename and keyword_lower in filename_lower:
+                        scores[folder_name] += 50
         
         # Look for CTD section numbers in text
         found_sections = self._extract_ctd_sections(text_lower)
@@ -226,109 +377,139 @@ class PDFProcessor:
             "text_sample": text[:500] if len(text) > 500 else text,
         }
     
-    def _extract_ctd_sections(self, text: str) -> List[str]:
+    def _extract_ctd_sections(self, text: str) -> Set[str]:
         """Extract CTD section numbers from text"""
-        patterns = [
-            r'\b(?:ctd|module)\s*(?:section)?\s*[:]?\s*([0-9]+(?:\.[0-9]+)+)\b',
-            r'\bsection\s*([0-9]+(?:\.[0-9]+)+)\b',
-            r'\b([0-9]+\.[0-9]+(?:\.[0-9]+)*)\b'
-        ]
-        
-        sections = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                section = match.strip()
-                if section.count('.') >= 1:
-                    sections.add(section)
-        
-        return list(sections)
+        # The patterns overlap heavily, so collect raw matches first and
+        # clean each distinct one once
+        matches = set()
+        for pattern in _CTD_SECTION_RES:
+            matches.update(pattern.findall(text))
+        
+        return {section for section in map(str.strip, matches) if '.' in section}
+    
+    def quick_section(self, pdf_path: str, known_sections) -> Set[str]:
+        """Return the known CTD sections cited on the first page
+        
+        Only PyMuPDF makes a one-page read cheap enough to try before the
+        full extraction, so without it this always returns an empty set.
+        """
+        if fitz is None:
+            return set()
+        
+        try:
+            text = self._extract_with_pymupdf(pdf_path, 1, None)
+        except Exception:
+            # The full extraction reports the error
+            return set()
+        
+        return known_sections & self._extract_ctd_sections(text.lower())
     
     def _clean_folder_name(self, name: str) -> str:
         """Clean folder name"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '-')
-        return ' '.join(name.split())
-    
-    def _get_file_hash(self, file_path: str) -> str:
-        """Generate hash for file"""
-        with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
+        return ' '.join(name.translate(_FOLDER_TRANS).split())
 
 
 class CTDOrganizer:
     """Organize documents into CTD structure with precise folder matching"""
     
     def __init__(self, ctd_structure_file: str = CTD_STRUCTURE_FILE):
+        self.ctd_structure_file = ctd_structure_file
         self.ctd_structure = self._load_ctd_structure(ctd_structure_file)
         self.pdf_processor = PDFProcessor()
-        self.pdf_processor.build_folder_index(self.ctd_structure, CTD_FOLDER)
         self.mapping_log = []
-        self.all_folders = self._get_all_folder_paths()
+        self.all_folders, folder_index = self._get_all_folder_paths()
+        self.pdf_processor.build_folder_index(self.ctd_structure, CTD_FOLDER, folder_index)
+        # Stat every known folder once instead of once per PDF, creating any
+        # missing ones so copies never need their own makedirs
+        for folder_path in set(self.all_folders.values()):
+            if not os.path.isdir(folder_path):
+                os.makedirs(folder_path, exist_ok=True)
+        self._existing_folders = set(self.all_folders.values())
+        self._build_lookup_indexes()
         
     def _load_ctd_structure(self, structure_file: str) -> Dict:
         """Load CTD structure from JSON file"""
+        # The default file is generated from the builder's definition,
+        # so reuse the in-memory structure instead of parsing it again
+        if structure_file == CTD_STRUCTURE_FILE:
+            return CTD_STRUCTURE
+        
         try:
+            if orjson is not None:
+                with open(structure_file, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(structure_file, 'r') as f:
                 return json.load(f)
         except FileNotFoundError:
             logger.error(f"CTD structure file not found: {structure_file}")
             raise
     
-    def _get_all_folder_paths(self) -> Dict[str, str]:
-        """Get all folder paths in the CTD structure"""
+    def _get_all_folder_paths(self) -> Tuple[Dict[str, str], Dict]:
+        """Get all folder paths in the CTD structure, plus the PDFProcessor folder index
+        
+        Both come from the same walk so the tree is only traversed once.
+        """
         folder_paths = {}
+        folder_index = {}
+        
+        for node, node_name, full_path in _walk_ctd_structure(self.ctd_structure, CTD_FOLDER):
+            folder_paths[node_name] = full_path
+            
+            # Also add section number if present
+            section_match = _SECTION_NUM_RE.search(node_name)
+            if section_match:
+                folder_paths[section_match.group(1)] = full_path
+            
+            PDFProcessor.index_folder(folder_index, node, node_name, full_path, section_match)
         
-        def traverse_node(node: Dict, current_path: str):
-            node_name = node.get("name", "")
-            if node_name:
-                folder_name = self._clean_folder_name(node_name)
-                full_path = os.path.join(current_path, folder_name) if current_path else folder_name
-                folder_paths[node_name] = full_path
-                
-                # Also add section number if present
-                section_match = re.search(r'(\d+(?:\.\d+)*)', node_name)
-                if section_match:
-                    folder_paths[section_match.group(1)] = full_path
-                
-                children = node.get("children", [])
-                for child in children:
-                    traverse_node(child, full_path)
-        
-        traverse_node(self.ctd_structure, CTD_FOLDER)
-        return folder_paths
+        return folder_paths, folder_index
+    
+    def _build_lookup_indexes(self):
+        """Precompute the folder lookups used for every PDF"""
+        # Partial section match: first existing folder whose key starts with the prefix
+        self._by_section_prefix = {}
+        for known_section, folder_path in self.all_folders.items():
+            if folder_path in self._existing_folders:
+                for end in range(1, len(known_section) + 1):
+                    self._by_section_prefix.setdefault(known_section[:end], (known_section, folder_path))
+        
+        # Keyword match: first existing folder whose name contains the keyword folder
+        self._by_keyword_folder = {folder_name: self._first_folder_containing(folder_name, existing_only=True)
+                                   for folder_name in CTD_KEYWORDS}
+        
+        # Filename match: first folder whose name contains the target folder name
+        self._by_target_name = {folder_name: self._first_folder_containing(folder_name)
+                                for _, folder_name in _FILENAME_PATTERNS + _FILENAME_FAST_PATTERNS}
+    
+    def _first_folder_containing(self, name: str, existing_only: bool = False) -> Optional[str]:
+        """Scan known folders for the first one whose name contains name"""
+        for known_name, folder_path in self.all_folders.items():
+            if name in known_name and (not existing_only or folder_path in self._existing_folders):
+                return folder_path
+        return None
     
     def find_exact_ctd_folder(self, analysis_result: Dict, filename: str = "") -> Tuple[str, str]:
         """Find the exact CTD folder for the document"""
         scores = analysis_result["scores"]
-        found_sections = analysis_result.get("found_sections", [])
+        found_sections = analysis_result.get("found_sections", ())
         
         # Strategy 1: Direct section number match
-        for section in found_sections:
-            # Try exact match first
-            if section in self.all_folders:
-                folder_path = self.all_folders[section]
-                if os.path.exists(folder_path):
-                    return folder_path, f"Exact CTD section match: {section}"
-            
-            # Try partial match
-            for known_section in self.all_folders.keys():
-                if isinstance(known_section, str) and known_section.startswith(section):
-                    folder_path = self.all_folders[known_section]
-                    if os.path.exists(folder_path):
-                        return folder_path, f"Partial CTD section match: {section} -> {known_section}"
+        section_match = self._match_sections(found_sections)
+        if section_match:
+            return section_match
         
         # Strategy 2: Keyword score match
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-        if sorted_scores:
-            top_folder, top_score = sorted_scores[0]
+        if scores:
+            top_folder, top_score = min(scores.items(),
+                                        key=lambda x: (-x[1], _KEYWORD_FOLDER_ORDER.get(x[0], 0)))
             if top_score > 10:
                 # Find this folder in our structure
-                for folder_name, folder_path in self.all_folders.items():
-                    if top_folder in folder_name:
-                        if os.path.exists(folder_path):
-                            return folder_path, f"Keyword match: {top_folder}"
+                if top_folder in self._by_keyword_folder:
+                    folder_path = self._by_keyword_folder[top_folder]
+                else:
+                    folder_path = self._first_folder_containing(top_folder, existing_only=True)
+                if folder_path:
+                    return folder_path, f"Keyword match: {top_folder}"
         
         # Strategy 3: Filename-based matching
         if filename:
@@ -339,42 +520,57 @@ class CTDOrganizer:
         # Default to Uncategorized
         uncategorized_path = os.path.join(CTD_FOLDER, "Uncategorized")
         os.makedirs(uncategorized_path, exist_ok=True)
+        self._existing_folders.add(uncategorized_path)
         return uncategorized_path, "No match found"
     
+    def _match_sections(self, found_sections) -> Optional[Tuple[str, str]]:
+        """Match folder based on CTD section numbers found in the document"""
+        # Every exact or partial hit is a key of the prefix index, so only
+        # the sections that can match at all need to be tried
+        for section in self._by_section_prefix.keys() & found_sections:
+            # Try exact match first
+            if section in self.all_folders:
+                folder_path = self.all_folders[section]
+                if folder_path in self._existing_folders:
+                    return folder_path, f"Exact CTD section match: {section}"
+            
+            # Try partial match
+            partial = self._by_section_prefix.get(section)
+            if partial:
+                known_section, folder_path = partial
+                return folder_path, f"Partial CTD section match: {section} -> {known_section}"
+        
+        return None
+    
     def _match_from_filename(self, filename: str) -> Optional[str]:
         """Match folder based on filename patterns"""
         filename_lower = filename.lower()
         
-        # Common patterns in filenames
-        patterns = [
-            (["cover letter", "cover-letter", "cover_letter", "emea-cover", "ema-cover"], "1.0.1 Cover Letter"),
-            (["application form", "application-form", "appform", "emea-form", "ema-form"], "1.2.1 Application Form"),
-            (["gmp certificate", "gmp-cert"], "1.7.3 GMP Certificates or Manufacturing Licences"),
-            (["smc", "summary of product"], "1.3.1 Summary of Product Characteristics (SmPC)"),
-            (["pil", "patient leaflet"], "1.3.2 Patient Information Leaflet (PIL)"),
-            (["clinical study", "study-report", "clinical-trial"], "5.3 Clinical Study Reports and Related Information"),
-            (["protocol", "study-protocol"], "5.3 Clinical Study Reports and Related Information"),
-            (["quality summary", "qos"], "2.3 Quality Overall Summary (QOS)"),
-            (["stability", "stability-study"], "3.2.P.8 Stability"),
-            (["specification", "spec"], "3.2.P.5 Control of Drug Product"),
-        ]
-        
-        for pattern_list, folder_name in patterns:
+        for pattern_list, folder_name in _FILENAME_PATTERNS:
             for pattern in pattern_list:
                 if pattern in filename_lower:
                     # Find the exact folder path
-                    for known_name, folder_path in self.all_folders.items():
-                        if folder_name in known_name:
-                            return folder_path
+                    folder_path = self._by_target_name.get(folder_name)
+                    if folder_path:
+                        return folder_path
+        
+        return None
+    
+    def _match_fast_filename(self, filename: str) -> Optional[str]:
+        """Match folder from unambiguous filename patterns, before any parsing"""
+        filename_lower = filename.lower()
+        
+        for pattern, folder_name in _FILENAME_FAST_PATTERNS:
+            if pattern.search(filename_lower):
+                folder_path = self._by_target_name.get(folder_name)
+                if folder_path:
+                    return folder_path
         
         return None
     
     def _clean_folder_name(self, name: str) -> str:
         """Clean folder name"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '-')
-        return ' '.join(name.split())
+        return ' '.join(name.translate(_FOLDER_TRANS).split())
     
     def organize_document(self, source_path: str, dest_folder: str) -> str:
         """Organize a single document WITHOUT creating JSON metadata"""
@@ -392,26 +588,25 @@ class CTDOrganizer:
             dest_path = os.path.join(dest_folder, dest_filename)
             counter += 1
         
-        # Ensure destination folder exists
-        os.makedirs(dest_folder, exist_ok=True)
-        
         # Copy file (preserve metadata) - NO JSON METADATA CREATED
-        shutil.copy2(source_path, dest_path)
+        # Destination folders are created up front in __init__
+        _copy_document(source_path, dest_path)
         
         return dest_path
     
-    def process_folder(self, source_folder: str = SOURCE_FOLDER):
-        """Process all documents in source folder"""
+    def process_folder(self, source_folder: str = SOURCE_FOLDER, pdf_files: Optional[List[str]] = None):
+        """Process all documents in source folder
+        
+        pdf_files may carry a listing the caller already made, so the
+        source folder is not walked a second time.
+        """
         if not os.path.exists(source_folder):
             logger.error(f"Source folder not found: {source_folder}")
             return
         
         # Get all PDF files
-        pdf_files = []
-        for root, dirs, files in os.walk(source_folder):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    pdf_files.append(os.path.join(root, file))
+        if pdf_files is None:
+            pdf_files = list(_iter_pdfs(source_folder))
         
         if not pdf_files:
             logger.warning(f"No PDF files found in {source_folder}")
@@ -424,55 +619,20 @@ class CTDOrganizer:
         print(f"\nFound {len(pdf_files)} PDF files to process")
         
         processed_count = 0
-        for pdf_file in pdf_files:
-            try:
-                filename = os.path.basename(pdf_file)
-                print(f"\n[PROCESSING] {filename}")
-                
-                # Extract text and analyze
-                text = self.pdf_processor.extract_text_from_pdf(pdf_file)
-                if not text.strip():
-                    print(f"  [!] No text extracted, skipping")
-                    continue
-                
-                analysis = self.pdf_processor.analyze_content(text, filename)
-                
-                # Find exact CTD folder
-                dest_folder, reason = self.find_exact_ctd_folder(analysis, filename)
-                
-                # Organize document (NO JSON metadata created)
-                dest_path = self.organize_document(pdf_file, dest_folder)
-                
-                # Get relative path for display
-                rel_path = os.path.relpath(dest_path, CTD_FOLDER)
-                
-                # Show clear path where file went
-                print(f"  ┌─[ORGANIZED TO]")
-                
-                # Split and display path
-                path_parts = rel_path.split(os.sep)
-                display_path = ""
-                for i, part in enumerate(path_parts):
-                    if i == 0:
-                        display_path = f"📁 {part}"
-                    else:
-                        display_path += f" → 📁 {part}"
-                
-                print(f"  │ {display_path}")
-                print(f"  └─[REASON] {reason}")
-                
-                self.mapping_log.append({
-                    "source": pdf_file,
-                    "destination": dest_path,
-                    "reason": reason,
-                    "filename": filename,
-                })
-                
-                processed_count += 1
-                
-            except Exception as e:
-                print(f"  [!] Error: {e}")
-                logger.error(f"Error processing {pdf_file}: {e}")
+        
+        # Classify PDFs in worker processes; copying and logging stay here
+        max_workers = min(os.cpu_count() or 1, len(pdf_files))
+        if sys.platform == 'win32':
+            # ProcessPoolExecutor rejects more than 61 workers on Windows
+            max_workers = min(max_workers, 61)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self.ctd_structure_file,)) as executor:
+            futures = {executor.submit(_classify_one, pdf_file): pdf_file for pdf_file in pdf_files}
+            
+            for future in as_completed(futures):
+                pdf_file = futures[future]
+                if self._organize_classified(pdf_file, future):
+                    processed_count += 1
         
         # Save mapping log (optional - only for reference)
         self._save_mapping_log()
@@ -487,6 +647,83 @@ class CTDOrganizer:
         
         # REMOVED: The folder-by-folder count summary
     
+    def classify_document(self, pdf_file: str) -> Tuple[Optional[str], str]:
+        """Find the CTD folder for a PDF; returns (None, reason) if it has no text"""
+        filename = os.path.basename(pdf_file)
+        
+        # Well-named files are classified without parsing the PDF at all; the
+        # looser substring patterns stay a last resort after content analysis
+        dest_folder = self._match_fast_filename(filename)
+        if dest_folder:
+            return dest_folder, f"Filename fast path: {filename}"
+        
+        # A section cited on the first page decides the folder before the full read
+        first_page_sections = self.pdf_processor.quick_section(pdf_file, self._by_section_prefix.keys())
+        section_match = self._match_sections(first_page_sections)
+        if section_match:
+            return section_match
+        
+        # Extract text and analyze
+        text = self.pdf_processor.extract_text_from_pdf(pdf_file)
+        if not text.strip():
+            return None, "No text extracted"
+        
+        analysis = self.pdf_processor.analyze_content(text, filename)
+        
+        # Find exact CTD folder
+        return self.find_exact_ctd_folder(analysis, filename)
+    
+    def _organize_classified(self, pdf_file: str, future) -> bool:
+        """Copy a classified PDF into place and report it; returns True on success"""
+        # Collect this file's report and write it in one go
+        buf = []
+        try:
+            filename = os.path.basename(pdf_file)
+            buf.append(f"\n[PROCESSING] {filename}\n")
+            
+            dest_folder, reason = future.result()
+            if dest_folder is None:
+                buf.append(f"  [!] No text extracted, skipping\n")
+                return False
+            
+            # Organize document (NO JSON metadata created)
+            dest_path = self.organize_document(pdf_file, dest_folder)
+            
+            # Get relative path for display
+            rel_path = os.path.relpath(dest_path, CTD_FOLDER)
+            
+            # Show clear path where file went
+            buf.append(f"  ┌─[ORGANIZED TO]\n")
+            
+            # Split and display path
+            path_parts = rel_path.split(os.sep)
+            display_path = ""
+            for i, part in enumerate(path_parts):
+                if i == 0:
+                    display_path = f"📁 {part}"
+                else:
+                    display_path += f" → 📁 {part}"
+            
+            buf.append(f"  │ {display_path}\n")
+            buf.append(f"  └─[REASON] {reason}\n")
+            
+            self.mapping_log.append({
+                "source": pdf_file,
+                "destination": dest_path,
+                "reason": reason,
+                "filename": filename,
+            })
+            
+            return True
+            
+        except Exception as e:
+            buf.append(f"  [!] Error: {e}\n")
+            logger.error(f"Error processing {pdf_file}: {e}")
+            return False
+        
+        finally:
+            sys.stdout.write(''.join(buf))
+    
     def _save_mapping_log(self):
         """Save mapping log to JSON file (optional, for reference only)"""
         log_data = {
@@ -495,8 +732,71 @@ class CTDOrganizer:
             "mappings": self.mapping_log
         }
         
-        with open("organized_mapping.json", 'w', encoding='utf-8') as f:
-            json.dump(log_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open("organized_mapping.json", 'wb') as f:
+                f.write(orjson.dumps(log_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open("organized_mapping.json", 'w', encoding='utf-8') as f:
+                json.dump(log_data, f, indent=2, ensure_ascii=False)
+
+
+def _iter_pdfs(root: str):
+    """Yield PDF paths below root, walking it with os.scandir"""
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # DirEntry carries the type from the directory read
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.name.lower().endswith('.pdf'):
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Cannot scan {folder}: {e}")
+        
+        # Reversed so subfolders are visited in listing order, like os.walk
+        stack.extend(reversed(subfolders))
+
+
+def _copy_document(source_path: str, dest_path: str):
+    """Copy file contents in the kernel where possible, then its metadata"""
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        # Zero-copy (and reflink on btrfs/xfs) without going through user space
+        try:
+            with open(source_path, 'rb') as src, open(dest_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            copied = False
+    
+    if not copied:
+        # shutil.copyfile already uses sendfile on Linux
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+
+
+# Per-process organizer used by the classification workers
+_worker_organizer = None
+
+
+def _init_worker(ctd_structure_file: str):
+    """Build the organizer once in each worker process"""
+    global _worker_organizer
+    _worker_organizer = CTDOrganizer(ctd_structure_file)
+
+
+def _classify_one(pdf_file: str) -> Tuple[Optional[str], str]:
+    """Classify a single PDF in a worker process"""
+    return _worker_organizer.classify_document(pdf_file)
 
 
 def main():
@@ -522,9 +822,9 @@ def main():
         print("Then run this script again.")
         return
     
-    # Check for PDFs
-    pdf_count = sum(1 for root, dirs, files in os.walk(SOURCE_FOLDER) 
-                   for file in files if file.lower().endswith('.pdf'))
+    # Check for PDFs (the listing is reused for processing)
+    pdf_files = list(_iter_pdfs(SOURCE_FOLDER))
+    pdf_count = len(pdf_files)
     
     if pdf_count == 0:
         print(f"WARNING: No PDF files found in: {SOURCE_FOLDER}")
@@ -543,7 +843,7 @@ def main():
     
     # Initialize organizer and process
     organizer = CTDOrganizer()
-    organizer.process_folder()
+    organizer.process_folder(pdf_files=pdf_files)
 
 
 if __name__ == "__main__":
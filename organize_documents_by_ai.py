@@ -7,34 +7,105 @@ Uses existing CTD folder structure from organized_ctd
 import os
 import re
 import json
+import sys
 import shutil
-import PyPDF2
-import pdfplumber
+import hashlib
+import mmap
+from collections import defaultdict
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import logging
+import logging.handlers
+import multiprocessing.util
 from typing import Dict, List, Optional, Tuple
 
+# Optional fast PDF text extractor (PyMuPDF); pdfplumber/PyPDF2 remain fallbacks
+# and are only imported when a file needs them
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz  # PyMuPDF releases before the pymupdf module name
+    except ImportError:
+        fitz = None
+
+# Optional multi-pattern keyword matcher; falls back to per-keyword scans
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configuration - EDIT THESE PATHS AS NEEDED
 SOURCE_FOLDER = "documents_to_organize"  # Your main folder with m1, m2, etc.
 CTD_FOLDER = "organized_ctd"  # Your existing CTD structure
 LOG_FILE = "document_organization.log"
 MAPPING_FILE = "document_mapping.json"
+MAPPING_RECORDS_FILE = "document_mapping.jsonl"
+TEXT_CACHE_FOLDER = ".ctd_cache"  # Extracted text, keyed by PDF content hash
+MAX_TEXT_CHARS = 20000  # Front matter is enough to classify; stop extracting after this
+
+# Cached text is only valid for the extractor and budget that produced it;
+# bump the version whenever extract_text changes what it returns
+_TEXT_CACHE_KEY = f"v1-{'pymupdf' if fitz is not None else 'pdfplumber'}-5p-{MAX_TEXT_CHARS}c"
+
+# CTD section patterns in folder names: "1.0.1" and "1.0 Correspondence"
+_SECTION_PATTERNS_FOLDER = (
+    re.compile(r'(\d+(?:\.\d+)+)'),  # Matches 1.0, 1.0.1, 1.2.3.4, etc.
+    re.compile(r'(\d+(?:\.\d+)*\s+[A-Za-z])'),  # Matches "1.0 Correspondence"
+)
+
+# CTD section references in lowercased document text
+_SECTION_PATTERNS_TEXT = (
+    re.compile(r'\bctd\s*(?:section)?\s*[:]?\s*([0-9]+(?:\.[0-9]+)+)\b'),
+    re.compile(r'\bsection\s*([0-9]+(?:\.[0-9]+)+)\b'),
+    re.compile(r'\bmodule\s*([0-9]+(?:\.[0-9]+)*)\b'),
+)
+
+# Filename fallbacks: (filename needles, mapping key term, section number, reason)
+_FILENAME_HEURISTICS = (
+    (("cover",), "cover", "1.0.1", "Filename suggests Cover Letter"),
+    (("application", "form"), "application", "1.2.1", "Filename suggests Application Form"),
+    (("stability",), "stability", "3.2.P.8", "Filename suggests Stability"),
+    (("clinical", "study"), "clinical", "5.3", "Filename suggests Clinical Study"),
+    (("toxicology", "tox"), "toxicology", "4.2.3", "Filename suggests Toxicology"),
+    (("gmp",), "gmp", None, "Filename suggests GMP"),
+)
 
-# Set up logging
+# Source module folders: m1, m2, ...
+_MODULE_RE = re.compile(r'^m\d+$', re.I)
+
+# Set up logging; file records are batched and written 1000 at a time
+# (errors are written straight away)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_memory_handler = logging.handlers.MemoryHandler(1000, target=_file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
+        _memory_handler,
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
 class CTDOrganizer:
-    def __init__(self):
-        self.folder_mapping = self._build_folder_mapping()
+    def __init__(self, folder_mapping: Optional[Dict[str, str]] = None):
+        # Workers reuse the parent's mapping instead of walking CTD_FOLDER again
+        self.folder_mapping = folder_mapping if folder_mapping is not None else self._build_folder_mapping()
         self.keywords = self._load_keywords()
+        self._keyword_pairs, self._keyword_automaton = self._build_keyword_automaton()
+        # get_destination walks the mapping for every unmatched section
+        self._folder_mapping_items = tuple(self.folder_mapping.items())
+        # Keys are lowercased once here rather than for every file
+        self._folder_mapping_lower_keys = tuple((section.lower(), section, folder_path)
+                                                for section, folder_path in self._folder_mapping_items)
+        self._build_section_automaton()
+        self._filename_heuristics = self._resolve_filename_heuristics()
+        # Section numbers found in text resolve to the same objects as the keys
+        self._interned = {s: sys.intern(s) for s in set(self.folder_mapping) | set(self.keywords)}
         self.processed_files = []
         
     def _build_folder_mapping(self) -> Dict[str, str]:
@@ -46,30 +117,17 @@ class CTDOrganizer:
             print("Please run the CTD structure builder first.")
             exit(1)
         
-        # Walk through the existing CTD structure
-        for root, dirs, files in os.walk(CTD_FOLDER):
-            # Skip the root folder itself
-            if root == CTD_FOLDER:
-                continue
-            
-            # Get the relative path from CTD_FOLDER
-            rel_path = os.path.relpath(root, CTD_FOLDER)
-            
-            # Extract CTD section numbers from folder names
-            folder_name = os.path.basename(root)
-            
+        # Walk through the existing CTD structure (the root folder itself is skipped)
+        for root, folder_name in _iter_folders(CTD_FOLDER):
             # Look for CTD section patterns
-            section_patterns = [
-                r'(\d+(?:\.\d+)+)',  # Matches 1.0, 1.0.1, 1.2.3.4, etc.
-                r'(\d+(?:\.\d+)*\s+[A-Za-z])',  # Matches "1.0 Correspondence"
-            ]
-            
-            for pattern in section_patterns:
-                matches = re.findall(pattern, folder_name)
-                for match in matches:
+            matches = [match for pattern in _SECTION_PATTERNS_FOLDER
+                       for match in pattern.findall(folder_name)]
+            if matches:
+                # Map the full folder name once, right after its first section
+                mapping[matches[0]] = root
+                mapping[folder_name] = root
+                for match in matches[1:]:
                     mapping[match] = root
-                    # Also map the full folder name
-                    mapping[folder_name] = root
             
             # Map common variations
             if "Cover Letter" in folder_name:
@@ -124,6 +182,70 @@ class CTDOrganizer:
             "5.3.5": ["efficacy", "safety", "clinical efficacy", "clinical safety", "controlled study", "randomized"],
         }
     
+    def _build_keyword_automaton(self):
+        """Flatten the keywords and build an Aho-Corasick automaton over them
+        
+        Returns the (section, keyword) pairs in scoring order and the
+        automaton, which is None when pyahocorasick is unavailable.
+        """
+        keyword_pairs = tuple((section, keyword)
+                              for section, keywords in self.keywords.items()
+                              for keyword in keywords)
+        if ahocorasick is None or not keyword_pairs:
+            return keyword_pairs, None
+        
+        automaton = ahocorasick.Automaton()
+        for _, keyword in keyword_pairs:
+            automaton.add_word(_automaton_input(keyword), keyword)
+        automaton.make_automaton()
+        return keyword_pairs, automaton
+    
+    def _matched_keywords(self, text: str) -> set:
+        """Return the keywords that occur in the lowercased text, in one pass"""
+        return {keyword for _, keyword in self._keyword_automaton.iter(_automaton_input(text))}
+    
+    def _build_section_automaton(self):
+        """Index the lowercased folder mapping keys for filename matching
+        
+        An automaton reports overlapping hits (both "1.3" and "1.3.1"), which
+        a regex alternation would not. It is None without pyahocorasick.
+        """
+        self._section_order = {section: i for i, section in enumerate(self.folder_mapping)}
+        self._sections_by_lower = {}
+        for section_lower, section, _ in self._folder_mapping_lower_keys:
+            self._sections_by_lower.setdefault(section_lower, []).append(section)
+        
+        self._section_automaton = None
+        # An automaton with no words cannot be searched
+        if ahocorasick is not None and self._sections_by_lower:
+            automaton = ahocorasick.Automaton()
+            for section_lower in self._sections_by_lower:
+                automaton.add_word(_automaton_input(section_lower), section_lower)
+            automaton.make_automaton()
+            self._section_automaton = automaton
+    
+    def _sections_in_filename(self, filename_lower: str) -> List[str]:
+        """Return the folder mapping keys contained in the filename, in mapping order"""
+        if self._section_automaton is None:
+            return [section for section_lower, section, _ in self._folder_mapping_lower_keys
+                    if section_lower in filename_lower]
+        
+        matched = {section_lower for _, section_lower in
+                   self._section_automaton.iter(_automaton_input(filename_lower))}
+        sections = [section for section_lower in matched for section in self._sections_by_lower[section_lower]]
+        sections.sort(key=self._section_order.__getitem__)
+        return sections
+    
+    def _resolve_filename_heuristics(self) -> Tuple[Tuple[Tuple[str, ...], str, str], ...]:
+        """Resolve each filename fallback to its folder once; unmatched ones are dropped"""
+        resolved = []
+        for needles, key_term, section_number, reason in _FILENAME_HEURISTICS:
+            for section_lower, section, folder_path in self._folder_mapping_lower_keys:
+                if key_term in section_lower or (section_number and section_number in section):
+                    resolved.append((needles, folder_path, reason))
+                    break
+        return tuple(resolved)
+    
     def find_all_pdfs(self) -> List[str]:
         """Recursively find all PDF files in source folder"""
         pdf_files = []
@@ -136,74 +258,161 @@ class CTDOrganizer:
         
         print(f"\n🔍 Scanning {SOURCE_FOLDER} for PDF files...")
         
-        for root, dirs, files in os.walk(SOURCE_FOLDER):
-            for file in files:
-                if file.lower().endswith('.pdf'):
-                    full_path = os.path.join(root, file)
-                    pdf_files.append(full_path)
+        pdf_files.extend(_iter_pdfs(SOURCE_FOLDER))
         
         return pdf_files
     
     def extract_text(self, pdf_path: str) -> str:
-        """Extract text from PDF"""
+        """Extract text from PDF, reusing text cached for identical content
+        
+        The file is memory-mapped once; the mapping is hashed for the cache
+        key and handed to PyMuPDF, so the content is only read from disk once.
+        """
         try:
-            text = ""
-            # Try pdfplumber first
+            with open(pdf_path, 'rb') as pdf_file:
+                data = _map_file(pdf_file)
+                try:
+                    if data is not None:
+                        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                    else:
+                        digest = _file_digest(pdf_path)
+                    cache_folder = os.path.join(TEXT_CACHE_FOLDER, _TEXT_CACHE_KEY)
+                    cache_path = os.path.join(cache_folder, digest + ".txt")
+                    
+                    try:
+                        with open(cache_path, 'r', encoding='utf-8', errors='surrogatepass') as f:
+                            return f.read()
+                    except (OSError, ValueError):
+                        # Missing or unreadable entry: extract again
+                        pass
+                    
+                    text = self._extract_text_uncached(pdf_path, data)
+                finally:
+                    if data is not None:
+                        data.close()
+        except OSError as e:
+            logger.error(f"Error extracting text from {pdf_path}: {e}")
+            return ""
+        
+        # Only cache real text so that failed extractions are retried next run;
+        # caching is best effort and never fails the file
+        if text.strip():
+            # Write under a per-process name, then swap in atomically
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
             try:
-                with pdfplumber.open(pdf_path) as pdf:
-                    for page in pdf.pages[:5]:  # First 5 pages
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                os.makedirs(cache_folder, exist_ok=True)
+                # surrogatepass keeps lone surrogates from PDF text round-tripping
+                with open(tmp_path, 'w', encoding='utf-8', errors='surrogatepass') as f:
+                    f.write(text)
+                os.replace(tmp_path, cache_path)
             except Exception as e:
-                logger.warning(f"pdfplumber failed: {e}")
-                # Fallback to PyPDF2
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page in pdf_reader.pages[:3]:  # First 3 pages
-                        page_text = page.extract_text()
-                        if page_text:
-                            text += page_text + "\n"
+                logger.warning(f"Could not cache text for {pdf_path}: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        
+        return text
+    
+    def _extract_text_uncached(self, pdf_path: str, data: Optional[mmap.mmap] = None) -> str:
+        """Extract text from PDF; PyMuPDF reads from data when the file is already mapped"""
+        try:
+            text = ""
+            # Try PyMuPDF first; classification only needs the flat text
+            if fitz is not None:
+                try:
+                    if data is not None:
+                        # PyMuPDF takes a memoryview of the mapping, not the mmap itself
+                        with memoryview(data) as view:
+                            with fitz.open(stream=view, filetype="pdf") as doc:
+                                text = self._read_pymupdf_pages(doc)
+                    else:
+                        with fitz.open(pdf_path) as doc:
+                            text = self._read_pymupdf_pages(doc)
+                except Exception as e:
+                    logger.warning(f"PyMuPDF failed: {e}")
+                    text = ""
+            
+            # Fall back to pdfplumber, then PyPDF2
+            if not text.strip():
+                text = ""
+                try:
+                    import pdfplumber
+                    with pdfplumber.open(pdf_path) as pdf:
+                        for page in pdf.pages[:5]:  # First 5 pages
+                            page_text = page.extract_text()
+                            if page_text:
+                                text += page_text + "\n"
+                                if len(text) >= MAX_TEXT_CHARS:
+                                    break
+                except Exception as e:
+                    logger.warning(f"pdfplumber failed: {e}")
+                    # Fallback to PyPDF2
+                    import PyPDF2
+                    with open(pdf_path, 'rb') as file:
+                        pdf_reader = PyPDF2.PdfReader(file)
+                        for page in pdf_reader.pages[:3]:  # First 3 pages
+                            page_text = page.extract_text()
+                            if page_text:
+                                text += page_text + "\n"
+                                if len(text) >= MAX_TEXT_CHARS:
+                                    break
             
             return text
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return ""
     
+    @staticmethod
+    def _read_pymupdf_pages(doc) -> str:
+        """Read the first pages of an open PyMuPDF document within the text budget"""
+        text_parts = []
+        total_len = 0
+        for page in doc.pages(0, min(5, doc.page_count)):  # First 5 pages
+            page_text = page.get_text("text")
+            if page_text:
+                text_parts.append(page_text + "\n")
+                total_len += len(page_text) + 1
+                if total_len >= MAX_TEXT_CHARS:
+                    break
+        return "".join(text_parts)
+    
     def analyze_document(self, text: str, filename: str) -> Dict:
         """Analyze document content and filename"""
         text_lower = text.lower()
         filename_lower = filename.lower()
         
         # Track scores for each CTD section
-        scores = {}
+        scores = defaultdict(int)
         
         # 1. Check filename for CTD indicators
-        for section, folder_path in self.folder_mapping.items():
-            if section.lower() in filename_lower:
-                scores[section] = scores.get(section, 0) + 50
+        for section in self._sections_in_filename(filename_lower):
+            scores[section] += 50
         
         # 2. Check content with keywords
-        for section, keywords in self.keywords.items():
-            for keyword in keywords:
+        if self._keyword_automaton is not None:
+            # Scan text and filename once each, then score in keyword order
+            in_text = self._matched_keywords(text_lower)
+            in_filename = self._matched_keywords(filename_lower)
+            for section, keyword in self._keyword_pairs:
+                if keyword in in_text:
+                    scores[section] += 10
+                if keyword in in_filename:
+                    scores[section] += 20
+        else:
+            for section, keyword in self._keyword_pairs:
                 if keyword in text_lower:
-                    scores[section] = scores.get(section, 0) + 10
+                    scores[section] += 10
                 if keyword in filename_lower:
-                    scores[section] = scores.get(section, 0) + 20
+                    scores[section] += 20
         
         # 3. Look for CTD section numbers in text
-        section_patterns = [
-            r'\bctd\s*(?:section)?\s*[:]?\s*([0-9]+(?:\.[0-9]+)+)\b',
-            r'\bsection\s*([0-9]+(?:\.[0-9]+)+)\b',
-            r'\bmodule\s*([0-9]+(?:\.[0-9]+)*)\b',
-        ]
-        
-        for pattern in section_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in _SECTION_PATTERNS_TEXT:
+            matches = pattern.findall(text_lower)
             for match in matches:
-                scores[match] = scores.get(match, 0) + 100
+                scores[self._interned.get(match, match)] += 100
         
-        return scores
+        return dict(scores)
     
     def get_destination(self, scores: Dict, filename: str) -> Tuple[str, str]:
         """Get destination folder based on scores"""
@@ -213,8 +422,14 @@ class CTDOrganizer:
             os.makedirs(uncategorized_path, exist_ok=True)
             return uncategorized_path, "Uncategorized (no matches found)"
         
+        # The top section is nearly always a mapping key; max() keeps the
+        # first of tied scores, as the stable sort below does
+        top_section, top_score = max(scores.items(), key=itemgetter(1))
+        if top_section in self.folder_mapping:
+            return self.folder_mapping[top_section], f"CTD Section {top_section} (score: {top_score})"
+        
         # Sort by score
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        sorted_scores = sorted(scores.items(), key=itemgetter(1), reverse=True)
         
         # Try to find the highest scoring section in folder mapping
         for section, score in sorted_scores:
@@ -223,45 +438,20 @@ class CTDOrganizer:
                 return self.folder_mapping[section], f"CTD Section {section} (score: {score})"
             
             # Try partial matches
-            for mapped_section, folder_path in self.folder_mapping.items():
+            for mapped_section, folder_path in self._folder_mapping_items:
                 if section in mapped_section or mapped_section in section:
                     return folder_path, f"CTD Section {mapped_section} (score: {score})"
         
         # Try common patterns in filename
-        if "cover" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "cover" in section.lower() or "1.0.1" in section:
-                    return folder_path, "Filename suggests Cover Letter"
-        
-        if "application" in filename.lower() or "form" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "application" in section.lower() or "1.2.1" in section:
-                    return folder_path, "Filename suggests Application Form"
-        
-        if "stability" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "stability" in section.lower() or "3.2.P.8" in section:
-                    return folder_path, "Filename suggests Stability"
-        
-        if "clinical" in filename.lower() or "study" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "clinical" in section.lower() or "5.3" in section:
-                    return folder_path, "Filename suggests Clinical Study"
-        
-        if "toxicology" in filename.lower() or "tox" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "toxicology" in section.lower() or "4.2.3" in section:
-                    return folder_path, "Filename suggests Toxicology"
-        
-        if "gmp" in filename.lower():
-            for section, folder_path in self.folder_mapping.items():
-                if "gmp" in section.lower():
-                    return folder_path, "Filename suggests GMP"
+        filename_lower = filename.lower()
+        for needles, folder_path, reason in self._filename_heuristics:
+            if any(needle in filename_lower for needle in needles):
+                return folder_path, reason
         
         # Default to Uncategorized
         uncategorized_path = os.path.join(CTD_FOLDER, "Uncategorized")
         os.makedirs(uncategorized_path, exist_ok=True)
-        return uncategorized_path, f"No confident match found (top score: {sorted_scores[0][0]}={sorted_scores[0][1]})"
+        return uncategorized_path, f"No confident match found (top score: {top_section}={top_score})"
     
     def organize_file(self, source_path: str, dest_folder: str) -> str:
         """Copy file to destination with unique name"""
@@ -272,7 +462,7 @@ class CTDOrganizer:
         module_name = ""
         rel_path = os.path.relpath(source_path, SOURCE_FOLDER)
         path_parts = rel_path.split(os.sep)
-        if path_parts and re.match(r'^m\d+$', path_parts[0], re.I):
+        if path_parts and _MODULE_RE.match(path_parts[0]):
             module_name = path_parts[0]
         
         # Create unique filename
@@ -284,17 +474,28 @@ class CTDOrganizer:
             new_filename = f"{name_part}_{timestamp}{ext_part}"
         
         dest_path = os.path.join(dest_folder, new_filename)
+        os.makedirs(dest_folder, exist_ok=True)
         
-        # Handle duplicates
+        # Handle duplicates: claim the name with an exclusive create, so a
+        # free name costs one open and only real collisions try the next one
         counter = 1
-        while os.path.exists(dest_path):
-            new_filename = f"{name_part}_{timestamp}_{counter}{ext_part}"
-            dest_path = os.path.join(dest_folder, new_filename)
-            counter += 1
+        while True:
+            try:
+                fd = os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                new_filename = f"{name_part}_{timestamp}_{counter}{ext_part}"
+                dest_path = os.path.join(dest_folder, new_filename)
+                counter += 1
+                continue
+            os.close(fd)
+            break
         
-        # Copy file
-        os.makedirs(dest_folder, exist_ok=True)
-        shutil.copy2(source_path, dest_path)
+        # Copy file over the claimed name
+        try:
+            _copy_pdf(source_path, dest_path)
+        except Exception:
+            os.remove(dest_path)
+            raise
         
         return dest_path
     
@@ -335,7 +536,7 @@ class CTDOrganizer:
         for pdf in pdf_files:
             rel_path = os.path.relpath(pdf, SOURCE_FOLDER)
             parts = rel_path.split(os.sep)
-            if parts and re.match(r'^m\d+$', parts[0], re.I):
+            if parts and _MODULE_RE.match(parts[0]):
                 modules.add(parts[0])
         
         if modules:
@@ -349,54 +550,72 @@ class CTDOrganizer:
         organized_count = 0
         failed_count = 0
         
-        for i, pdf_file in enumerate(pdf_files, 1):
-            try:
-                filename = os.path.basename(pdf_file)
-                rel_path = os.path.relpath(pdf_file, SOURCE_FOLDER)
-                
-                print(f"\n[{i}/{len(pdf_files)}] Processing: {filename}")
-                print(f"   📍 Source: {rel_path}")
+        # Extract and score PDFs in worker processes; placing and copying stay here
+        max_workers = min(os.cpu_count() or 1, len(pdf_files))
+        if sys.platform == 'win32':
+            # ProcessPoolExecutor rejects more than 61 workers on Windows
+            max_workers = min(max_workers, 61)
+        # Write out pending log records first, so forked workers do not
+        # inherit (and later write) their own copies of them
+        _memory_handler.flush()
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(self.folder_mapping,)) as executor:
+            # One JSON record per line, flushed per line, written as files are placed
+            with open(MAPPING_RECORDS_FILE, 'w', encoding='utf-8', buffering=1) as records:
+                futures = {executor.submit(_score_one, pdf_file): pdf_file for pdf_file in pdf_files}
                 
-                # Extract text
-                text = self.extract_text(pdf_file)
-                
-                if not text.strip():
-                    print("   ⚠️  Could not extract text, using filename only")
-                    text = filename
-                
-                # Analyze document
-                scores = self.analyze_document(text, filename)
-                
-                # Get destination
-                dest_folder, reason = self.get_destination(scores, filename)
-                
-                # Organize file
-                dest_path = self.organize_file(pdf_file, dest_folder)
-                
-                # Get relative path for display
-                dest_rel = os.path.relpath(dest_path, CTD_FOLDER)
-                dest_parts = dest_rel.split(os.sep)
-                display_path = " → ".join(dest_parts)
-                
-                print(f"   📋 Classification: {reason}")
-                print(f"   📂 Destination: {display_path}")
-                
-                # Record processing
-                self.processed_files.append({
-                    "source": pdf_file,
-                    "destination": dest_path,
-                    "classification": reason,
-                    "filename": filename,
-                    "source_path": rel_path,
-                    "timestamp": datetime.now().isoformat()
-                })
-                
-                organized_count += 1
-                
-            except Exception as e:
-                print(f"   ❌ Error: {str(e)}")
-                failed_count += 1
-                logger.error(f"Error processing {pdf_file}: {e}")
+                for i, future in enumerate(as_completed(futures), 1):
+                    pdf_file = futures[future]
+                    # Collect this file's report and write it in one go
+                    buf = []
+                    try:
+                        filename = os.path.basename(pdf_file)
+                        rel_path = os.path.relpath(pdf_file, SOURCE_FOLDER)
+                        
+                        buf.append(f"\n[{i}/{len(pdf_files)}] Processing: {filename}\n")
+                        buf.append(f"   📍 Source: {rel_path}\n")
+                        
+                        # Text extraction and analysis ran in the worker
+                        scores, has_text = future.result()
+                        
+                        if not has_text:
+                            buf.append("   ⚠️  Could not extract text, using filename only\n")
+                        
+                        # Get destination
+                        dest_folder, reason = self.get_destination(scores, filename)
+                        
+                        # Organize file
+                        dest_path = self.organize_file(pdf_file, dest_folder)
+                        
+                        # Get relative path for display
+                        dest_rel = os.path.relpath(dest_path, CTD_FOLDER)
+                        dest_parts = dest_rel.split(os.sep)
+                        display_path = " → ".join(dest_parts)
+                        
+                        buf.append(f"   📋 Classification: {reason}\n")
+                        buf.append(f"   📂 Destination: {display_path}\n")
+                        
+                        # Record processing; each record is on disk as soon as it is known
+                        record = {
+                            "source": pdf_file,
+                            "destination": dest_path,
+                            "classification": reason,
+                            "filename": filename,
+                            "source_path": rel_path,
+                            "timestamp": datetime.now().isoformat()
+                        }
+                        self.processed_files.append(record)
+                        records.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        
+                        organized_count += 1
+                        
+                    except Exception as e:
+                        buf.append(f"   ❌ Error: {str(e)}\n")
+                        failed_count += 1
+                        logger.error(f"Error processing {pdf_file}: {e}")
+                    
+                    finally:
+                        sys.stdout.write(''.join(buf))
         
         # Save mapping
         self._save_mapping()
@@ -404,15 +623,31 @@ class CTDOrganizer:
         # Print summary
         self._print_summary(organized_count, failed_count, pdf_files)
     
+    def score_document(self, pdf_file: str) -> Tuple[Dict, bool]:
+        """Extract and analyze a PDF; returns its scores and whether it had text"""
+        filename = os.path.basename(pdf_file)
+        
+        text = self.extract_text(pdf_file)
+        has_text = bool(text.strip())
+        if not has_text:
+            # Fall back to scoring the filename only
+            text = filename
+        
+        return self.analyze_document(text, filename), has_text
+    
     def _save_mapping(self):
-        """Save mapping to JSON file"""
+        """Save the mapping summary to JSON file
+        
+        The per-file records are already in MAPPING_RECORDS_FILE, one JSON
+        object per line; the summary only points at them.
+        """
         if self.processed_files:
             mapping_data = {
                 "timestamp": datetime.now().isoformat(),
                 "source_folder": SOURCE_FOLDER,
                 "ctd_folder": CTD_FOLDER,
                 "total_files": len(self.processed_files),
-                "mappings": self.processed_files,
+                "mappings_file": MAPPING_RECORDS_FILE,
                 "folder_mapping_summary": {k: os.path.relpath(v, CTD_FOLDER) 
                                           for k, v in list(self.folder_mapping.items())[:20]}  # First 20
             }
@@ -452,6 +687,7 @@ class CTDOrganizer:
         print(f"\n📂 Organized files are in: {CTD_FOLDER}")
         print(f"📝 Log file: {LOG_FILE}")
         print(f"📋 Mapping file: {MAPPING_FILE}")
+        print(f"📋 Mapping records: {MAPPING_RECORDS_FILE}")
         
         # Show example of where files went
         print(f"\n📌 EXAMPLE DESTINATIONS:")
@@ -460,6 +696,112 @@ class CTDOrganizer:
             dest_rel = os.path.relpath(item['destination'], CTD_FOLDER)
             print(f"   • {filename[:30]}... → {dest_rel}")
 
+def _automaton_input(text: str):
+    """Encode lowercased text for the automaton (bytes builds scan bytes)"""
+    return text if _KEYWORD_AUTOMATON_UNICODE else text.encode('utf-8', 'ignore')
+
+# Standard pyahocorasick wheels are unicode builds
+_KEYWORD_AUTOMATON_UNICODE = ahocorasick is None or bool(ahocorasick.unicode)
+
+
+def _map_file(pdf_file) -> Optional[mmap.mmap]:
+    """Map an open file read-only; None if it is empty or cannot be mapped"""
+    try:
+        return mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return None
+
+
+def _file_digest(path: str) -> str:
+    """BLAKE2b digest of a file's content, read in 1 MiB chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _copy_pdf(source_path: str, dest_path: str):
+    """Copy file contents only; the timestamped name already records when"""
+    # copyfile uses the kernel's fast copy (sendfile and friends) where available
+    shutil.copyfile(source_path, dest_path)
+    
+    # The source is not read again this run, so drop it from the page cache
+    if hasattr(os, "posix_fadvise"):
+        try:
+            fd = os.open(source_path, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+
+
+def _iter_folders(root: str):
+    """Yield (path, name) for every folder below root, parents first like os.walk"""
+    stack = [(root, None)]
+    while stack:
+        folder, name = stack.pop()
+        if name is not None:
+            yield folder, name
+        
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                # DirEntry carries the type from the directory read
+                # Directory symlinks are not followed, as with os.walk
+                subfolders = [(entry.path, entry.name) for entry in entries
+                              if entry.is_dir(follow_symlinks=False)]
+        except OSError as e:
+            logger.warning(f"Cannot scan {folder}: {e}")
+        
+        # Reversed so subfolders are visited in listing order
+        stack.extend(reversed(subfolders))
+
+
+def _iter_pdfs(root: str):
+    """Yield PDF paths below root, walking it with os.scandir"""
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # DirEntry carries the type from the directory read
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.name.lower().endswith('.pdf'):
+                        yield entry.path
+        except OSError as e:
+            logger.warning(f"Cannot scan {folder}: {e}")
+        
+        # Reversed so subfolders are visited in listing order, like os.walk
+        stack.extend(reversed(subfolders))
+
+
+# Per-process organizer used by the scoring workers
+_worker_organizer = None
+
+
+def _init_worker(folder_mapping: Dict[str, str]):
+    """Build the organizer once in each worker process"""
+    global _worker_organizer
+    _worker_organizer = CTDOrganizer(folder_mapping)
+    # A forked worker starts with a copy of the parent's log buffer; drop it
+    # so only this worker's own records are written
+    with _memory_handler.lock:
+        _memory_handler.buffer.clear()
+    # Workers skip atexit, so flush batched log records when the worker exits
+    multiprocessing.util.Finalize(None, logging.shutdown, exitpriority=0)
+
+
+def _score_one(pdf_file: str) -> Tuple[Dict, bool]:
+    """Score a single PDF in a worker process"""
+    return _worker_organizer.score_document(pdf_file)
+
+
 def main():
     """Main function"""
     print("\n" + "="*60)
@@ -483,13 +825,16 @@ def main():
     organizer.process_documents()
 
 if __name__ == "__main__":
-    try:
-        import PyPDF2
-        import pdfplumber
-    except ImportError:
-        print("ERROR: Required packages not installed.")
-        print("\nPlease install with:")
-        print("pip install PyPDF2 pdfplumber")
-        exit(1)
+    # PyMuPDF alone is enough; without it both fallback libraries are needed
+    if fitz is None:
+        try:
+            import PyPDF2
+            import pdfplumber
+        except ImportError:
+            print("ERROR: Required packages not installed.")
+            print("\nPlease install with:")
+            print("pip install pymupdf")
+            print("or: pip install PyPDF2 pdfplumber")
+            exit(1)
     
     main()
\ No newline at end of file